@@ -1,8 +1,27 @@
-from utils.utils import extract_data_to_list
+import bisect
+import heapq
+import itertools
+import os
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from utils.utils import get_raw_input_stream, iter_lines
+
+# NumPy and tempfile are only imported by the functions that need them
+if TYPE_CHECKING:
+    import numpy as np
+
+Lists = tuple[list[int], list[int]]
+Arrays = tuple["np.ndarray", "np.ndarray"]
+# The path of a sorted run file and the side (LEFT or RIGHT) of the list
+# its numbers came from
+Run = tuple[str, int]
+
+LEFT, RIGHT = 0, 1
 
 
 def split_data(
-    data: list[str],
+    data: Iterable[str],
     deliminator: str = " ",
 ) -> tuple[list[int], list[int]]:
     """
@@ -23,12 +42,10 @@ def split_data(
 def calc_diff(left: list[int], right: list[int]) -> int:
     """
     Returns the sum of differences between each pair of numbers in both list.
-    Sorts the the list in place.
+    Sorts copies of the lists so they are left unchanged.
     """
-    left.sort()
-    right.sort()
     total_diff = 0
-    for left_val, right_val in zip(left, right):
+    for left_val, right_val in zip(sorted(left), sorted(right)):
         total_diff += abs(left_val - right_val)
     return total_diff
 
@@ -58,11 +75,204 @@ def calc_similarity(left: list[int], right: list[int]) -> int:
     return similarity
 
 
-def solution() -> tuple[int, int]:
-    """Returns the solutions for Day 1 of Advent of Code"""
-    data = extract_data_to_list(1)
-    left, right = split_data(data)
-    solution_1 = calc_diff(left, right)
-    solution_2 = calc_similarity(left, right)
+def split_data_arrays(data: str) -> Arrays:
+    """
+    Returns the left and right columns of the data as int64 arrays, parsed
+    in one pass over the whole text
+    """
+    import numpy as np
+
+    pairs = np.fromstring(data, dtype=np.int64, sep=" ").reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def calc_diff_arrays(left: "np.ndarray", right: "np.ndarray") -> int:
+    """
+    Returns the sum of differences between each pair of numbers in both
+    sorted arrays. The arrays are left unchanged.
+    """
+    import numpy as np
+
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+def calc_similarity_arrays(left: "np.ndarray", right: "np.ndarray") -> int:
+    """
+    Returns the similarity score of the arrays by looking up the frequency
+    of each number of left among the unique numbers of right
+    """
+    import numpy as np
+
+    nums, counts = np.unique(right, return_counts=True)
+    if not nums.size:
+        return 0
+    indices = np.searchsorted(nums, left).clip(max=nums.size - 1)
+    freqs = np.where(nums[indices] == left, counts[indices], 0)
+    return int((left * freqs).sum())
+
+
+def write_sorted_runs(
+    lines: Iterable[str], directory: str, chunk_size: int
+) -> list[Run]:
+    """
+    Splits the lines into chunks of at most chunk_size lines and writes the
+    sorted left and right numbers of each chunk to their own run files in
+    directory. Returns the runs.
+    """
+    runs = []
+    lines = iter(lines)
+    for index in itertools.count():
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        for side, nums in enumerate(split_data(chunk)):
+            fp = os.path.join(directory, f"run-{index}-{side}.txt")
+            with open(fp, "w") as file_obj:
+                file_obj.writelines(f"{num}\n" for num in sorted(nums))
+            runs.append((fp, side))
+    return runs
+
+
+def iter_run(run: Run) -> Iterator[tuple[int, int]]:
+    """Yields each number of a run file along with the side it came from"""
+    fp, side = run
+    with open(fp, "r") as file_obj:
+        for line in file_obj:
+            yield int(line), side
+
+
+def calc_diff_and_similarity_merged(
+    merged: Iterable[tuple[int, int]]
+) -> tuple[int, int]:
+    """
+    Returns the total distance and the similarity score of both lists from
+    one sorted stream of all of their numbers tagged with their side.
+    Pairing the i-th smallest numbers of each list means that between two
+    consecutive numbers every unmatched number (the difference in how many
+    numbers each list has had so far) adds the gap to the distance, so the
+    lists never have to be walked side by side. Assumes lists of equal
+    length.
+    """
+    total_diff = similarity = 0
+    unmatched = 0
+    prev_num = None
+    for num, group in itertools.groupby(merged, key=lambda item: item[0]):
+        if prev_num is not None:
+            total_diff += abs(unmatched) * (num - prev_num)
+        counts = [0, 0]
+        for _, side in group:
+            counts[side] += 1
+        unmatched += counts[0] - counts[1]
+        similarity += num * counts[0] * counts[1]
+        prev_num = num
+    return total_diff, similarity
+
+
+def solve_out_of_core(
+    lines: Iterable[str], chunk_size: int = 1_000_000,
+    directory: str | None = None
+) -> tuple[int, int]:
+    """
+    Returns the total distance and the similarity score of lists that may
+    not fit in memory. Sorted runs of chunk_size lines are written to a
+    temporary directory (inside directory if given) and merged in a single
+    streaming pass, so memory is bounded by the chunk size.
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir=directory) as run_dir:
+        runs = write_sorted_runs(lines, run_dir, chunk_size)
+        return calc_diff_and_similarity_merged(
+            heapq.merge(*map(iter_run, runs))
+        )
+
+
+class LocationLists:
+    """
+    Both location lists kept sorted along with the frequency of each number,
+    so numbers can be inserted and deleted as they arrive. The similarity
+    score is updated in O(1) per change. The distance is recomputed from the
+    sorted lists (without sorting them again) the next time it is read after
+    a change.
+    """
+
+    def __init__(
+        self, left: Iterable[int] = (), right: Iterable[int] = ()
+    ) -> None:
+        self.sides = (sorted(left), sorted(right))
+        self.counts = (Counter(self.sides[LEFT]), Counter(self.sides[RIGHT]))
+        self.similarity = sum(
+            num * count * self.counts[RIGHT][num]
+            for num, count in self.counts[LEFT].items()
+        )
+        self._distance: int | None = None
+
+    @classmethod
+    def from_data(cls, data: str) -> "LocationLists":
+        """Returns the location lists found in the raw data"""
+        return cls(*parse(data))
 
-    return solution_1, solution_2
+    def insert(self, side: int, num: int) -> None:
+        """Adds num to the LEFT or RIGHT list"""
+        bisect.insort(self.sides[side], num)
+        self.counts[side][num] += 1
+        # Each copy of num on one side adds num once per copy on the other
+        self.similarity += num * self.counts[1 - side][num]
+        self._distance = None
+
+    def delete(self, side: int, num: int) -> None:
+        """
+        Removes one occurrence of num from the LEFT or RIGHT list. Raises a
+        ValueError if the list does not contain num.
+        """
+        if not self.counts[side][num]:
+            raise ValueError(f"{num} is not in the list")
+        nums = self.sides[side]
+        del nums[bisect.bisect_left(nums, num)]
+        self.counts[side][num] -= 1
+        if not self.counts[side][num]:
+            del self.counts[side][num]
+        self.similarity -= num * self.counts[1 - side][num]
+        self._distance = None
+
+    @property
+    def distance(self) -> int:
+        """Returns the total distance between the lists"""
+        if self._distance is None:
+            self._distance = sum(
+                abs(left_val - right_val)
+                for left_val, right_val in zip(*self.sides)
+            )
+        return self._distance
+
+
+def parse(data: str) -> Lists:
+    """Returns the left and right lists of location ids in the data"""
+    return split_data(data.splitlines())
+
+
+def part_1(lists: Lists) -> int:
+    """Returns the total distance between the lists"""
+    return calc_diff(*lists)
+
+
+def part_2(lists: Lists) -> int:
+    """Returns the similarity score of the lists"""
+    return calc_similarity(*lists)
+
+
+def solution(
+    vectorized: bool = False, chunk_size: int | None = None
+) -> tuple[int, int]:
+    """
+    Returns the solutions for Day 1 of Advent of Code. The vectorized path
+    uses NumPy, which pays off for very long lists. Passing chunk_size
+    solves the input out of core with sorted runs of that many lines.
+    """
+    if chunk_size is not None:
+        return solve_out_of_core(iter_lines(1), chunk_size)
+    if vectorized:
+        arrays = split_data_arrays(get_raw_input_stream(1))
+        return calc_diff_arrays(*arrays), calc_similarity_arrays(*arrays)
+    lists = split_data(iter_lines(1))
+    return part_1(lists), part_2(lists)
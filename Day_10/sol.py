@@ -1,53 +1,26 @@
-from utils.utils import extract_data_to_list_of_list
+from utils.utils import Grid, get_raw_input_stream, split_lines
 
-Grid = list[list[int]]
-Point = tuple[int, int]
+Point = int  # Flat index of a cell in the Grid
 
-
-def convert_to_grid(data: list[list[str]]) -> Grid:
-    """Returns a list of list of ints from a list of list of strings"""
-    grid = []
-    for row in data:
-        grid.append([int(num) for num in row])
-    return grid
+PEAK = ord('9')
 
 
 def find_trail_heads(grid: Grid) -> list[Point]:
-    """Return a list of all 0 positions in the data"""
-    trail_heads = []
-    for row, nums in enumerate(grid):
-        for col, num in enumerate(nums):
-            if num == 0:
-                trail_heads.append((row, col))
-    return trail_heads
-
-
-def in_bounds(point: Point, grid: Grid) -> bool:
-    """Returns true if the point is within the bounds of the grid"""
-    row, col = point
-    row_max, col_max = len(grid), len(grid[0])
-    return 0 <= row < row_max and 0 <= col < col_max
+    """Return a list of all 0 positions in the grid"""
+    return grid.find_all('0')
 
 
-def get_val(grid: Grid, point: Point) -> int:
-    """Returns the value at the given point"""
-    row, col = point
-    return grid[row][col]
-
-
-def get_available_moves(point: Point, cur_val: int, grid: Grid) -> list[Point]:
+def get_available_moves(point: Point, grid: Grid) -> list[Point]:
     """
     Returns a list of points that are one more than
     the value at point on the grid
     """
-    row, col = point
-    tar_val = cur_val + 1
-    available_moves = []
-    for row_diff, col_diff in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
-        new_point = (row + row_diff, col + col_diff)
-        if in_bounds(new_point, grid) and get_val(grid, new_point) == tar_val:
-            available_moves.append(new_point)
-    return available_moves
+    cells = grid.cells
+    tar_val = cells[point] + 1
+    return [
+        neighbor for neighbor in grid.neighbors(point)
+        if cells[neighbor] == tar_val
+    ]
 
 
 def next_move(grid: Grid, point: Point, end_points: list[Point]) -> None:
@@ -55,11 +28,10 @@ def next_move(grid: Grid, point: Point, end_points: list[Point]) -> None:
     Recursively finds paths starting from the given point.
     Returns when no moves are available or the current value is 9
     """
-    cur_val = get_val(grid, point)
-    if cur_val == 9:
+    if grid.cells[point] == PEAK:
         end_points.append(point)
     else:
-        moves = get_available_moves(point, cur_val, grid)
+        moves = get_available_moves(point, grid)
         for move in moves:
             next_move(grid, move, end_points)
     return
@@ -78,9 +50,22 @@ def find_paths(grid: Grid, trail_heads: list[Point]) -> tuple[int, int]:
     return total_unique_trails, total_paths
 
 
-def solution() -> tuple[int, int]:
-    grid = convert_to_grid(extract_data_to_list_of_list(10))
-    trail_heads = find_trail_heads(grid)
-    sol_1, sol_2 = find_paths(grid, trail_heads)
+def parse(data: str) -> Grid:
+    """Returns the topographic map as a grid"""
+    return Grid(split_lines(data))
 
-    return sol_1, sol_2
+
+def part_1(grid: Grid) -> int:
+    """Returns the sum of the scores of the trail heads"""
+    return find_paths(grid, find_trail_heads(grid))[0]
+
+
+def part_2(grid: Grid) -> int:
+    """Returns the sum of the ratings of the trail heads"""
+    return find_paths(grid, find_trail_heads(grid))[1]
+
+
+def solution() -> tuple[int, int]:
+    """Returns a solution as a tuple of ints"""
+    grid = parse(get_raw_input_stream(10))
+    return find_paths(grid, find_trail_heads(grid))
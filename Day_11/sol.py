@@ -1,3 +1,4 @@
+from utils.memo import memoize
 from utils.utils import get_raw_input_stream
 
 Numbers = list[int]
@@ -34,43 +35,55 @@ def apply_rules(stones: Numbers) -> Numbers:
     return new_stones
 
 
-def blink(stones_map: dict[int, int]) -> Numbers:
-    """Applies the rules after blinking once"""
-    stones = [
-        stone for stone in stones_map.keys() if stones_map[stone]['count'] > 0
-    ]
-    cache = {}
-    for stone in stones:
-        if not stones_map[stone].get('turns_into'):
-            stones_map[stone]['turns_into'] = apply_rules([stone])
-        for new_stone in stones_map[stone]['turns_into']:
-            count = stones_map[stone]['count']
-            cache[new_stone] = cache.get(new_stone, 0) + count
-        stones_map[stone]['count'] = 0
-    for new_stone in cache.keys():
-        if not stones_map.get(new_stone):
-            stones_map[new_stone] = {'count': cache[new_stone]}
-        else:
-            stones_map[new_stone]['count'] += cache[new_stone]
-    return
+@memoize(maxsize=1 << 14)
+def change(stone: int) -> tuple[int, ...]:
+    """
+    Returns the stones a stone turns into after one blink. Only a few
+    thousand distinct stones ever appear, so the bound is never reached for
+    real inputs.
+    """
+    return tuple(apply_rules([stone]))
+
+
+def blink(stones: dict[int, int]) -> dict[int, int]:
+    """Returns the count of each stone after blinking once"""
+    new_stones = {}
+    for stone, count in stones.items():
+        for new_stone in change(stone):
+            new_stones[new_stone] = new_stones.get(new_stone, 0) + count
+    return new_stones
 
 
 def multiple_blinks(stones: Numbers, blinks: int) -> int:
     """Blinks multiple times"""
-    cache = {}
-    for stones in stones:
-        cache[stones] = {'count': 1}
+    # Every call starts from an empty cache so repeated runs redo the work
+    change.cache_clear()
+    counts = {}
+    for stone in stones:
+        counts[stone] = counts.get(stone, 0) + 1
 
     for _ in range(blinks):
-        blink(cache)
+        counts = blink(counts)
+
+    return sum(counts.values())
+
+
+def parse(data: str) -> Numbers:
+    """Returns the numbers engraved on the stones"""
+    return convert_to_numbers(data.strip())
+
+
+def part_1(stones: Numbers) -> int:
+    """Returns the number of stones after blinking 25 times"""
+    return multiple_blinks(stones, 25)
+
 
-    return sum([cache[stone]['count'] for stone in cache.keys()])
+def part_2(stones: Numbers) -> int:
+    """Returns the number of stones after blinking 75 times"""
+    return multiple_blinks(stones, 75)
 
 
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    stones = convert_to_numbers(get_raw_input_stream(11))
-    sol_1 = multiple_blinks(stones, 25)
-    stones = convert_to_numbers(get_raw_input_stream(11))
-    sol_2 = multiple_blinks(stones, 75)
-    return sol_1, sol_2
+    stones = parse(get_raw_input_stream(11))
+    return part_1(stones), part_2(stones)
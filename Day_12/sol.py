@@ -1,34 +1,25 @@
-from utils.utils import extract_data_to_list_of_list
+from utils.profiling import profiled
+from utils.search import bfs
+from utils.trace import TRACING, emit
+from utils.utils import Grid, get_raw_input_stream, split_lines
 
-Grid = list[list[str]]
-Point = tuple[int, int]
-Hash = dict[str, int]
+Point = int  # Flat index of a cell in the Grid
+Regions = dict[int, dict[str, int | str]]
 
 
 def is_diff(grid: Grid, point: Point, neighbor: Point) -> bool:
-    """Returns true if the plots at point and neighbor are the different"""
-    row, col = point
-    neighbor_row, neighbor_col = neighbor
-    return grid[row][col] != grid[neighbor_row][neighbor_col]
-
-
-def is_out_of_bounds(grid: Grid, point: Point) -> bool:
-    """Returns true if the point is out of bounds"""
-    row_max, col_max = len(grid), len(grid[0])
-    row, col = point
-    return not (0 <= row < row_max and 0 <= col < col_max)
+    """
+    Returns true if the plots at point and neighbor are the different. The
+    sentinel border differs from every plot.
+    """
+    return grid.cells[point] != grid.cells[neighbor]
 
 
 def is_outside_corner(
     grid: Grid, corner: Point, point_1: Point, point_2: Point
 ) -> bool:
     """Return's true if point is a corner with respect to points 1 and 2"""
-
-    return (
-        (is_out_of_bounds(grid, point_1) or is_diff(grid, corner, point_1))
-        and
-        (is_out_of_bounds(grid, point_2) or is_diff(grid, corner, point_2))
-    )
+    return is_diff(grid, corner, point_1) and is_diff(grid, corner, point_2)
 
 
 def is_inside_corner(
@@ -38,23 +29,21 @@ def is_inside_corner(
     Returns True if corner, point_1, point_2 form
     a Match, Different, Match pattern
     """
-    # Inside corners cannot occur on boundaries
-    if is_out_of_bounds(grid, point_1) or is_out_of_bounds(grid, point_2):
-        return False
-    if is_diff(grid, corner, point_1) and not is_diff(grid, corner, point_2):
-        return True
-    return False
+    # The diagonal point_2 is on the border whenever point_1 is, so inside
+    # corners cannot occur on boundaries
+    return (
+        is_diff(grid, corner, point_1) and not is_diff(grid, corner, point_2)
+    )
 
 
 def get_num_corners(grid: Grid, corner: Point) -> int:
     """Returns the number of corners at a point"""
-    row, col = corner
     corners = 0
-    for _, hor_diff in [(0, -1), (0, 1)]:
-        for vert_diff, _ in [(-1, 0), (1, 0)]:
-            point_1 = row, col + hor_diff
-            point_2 = row + vert_diff, col
-            point_3 = point_1[0] + vert_diff, point_1[1]
+    for hor_diff in (-1, 1):
+        for vert_diff in (-grid.stride, grid.stride):
+            point_1 = corner + hor_diff
+            point_2 = corner + vert_diff
+            point_3 = point_1 + vert_diff
             if is_outside_corner(grid, corner, point_1, point_2):
                 corners += 1
             elif is_inside_corner(grid, corner, point_1, point_3):
@@ -62,108 +51,50 @@ def get_num_corners(grid: Grid, corner: Point) -> int:
     return corners
 
 
-def get_adjacent_plots(point: Point) -> list[Point]:
-    """
-    Returns the points to the left, right, above, and below the given point
-    """
-    neighbors = []
-    row, col = point
-    for row_diff, col_diff in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
-        neighbor = (row+row_diff, col+col_diff)
-        neighbors.append(neighbor)
-    return neighbors
-
-
 def get_perimeter_per_point(grid: Grid, point: Point) -> int:
     """
     Finds the number of sides that are on the boundary of the grid
     or contain a plot that does not match the grid
     """
-    neighbors = get_adjacent_plots(point)
-    perimeter = 0
-    for neighbor in neighbors:
-        if is_out_of_bounds(grid, neighbor) or is_diff(grid, point, neighbor):
-            perimeter += 1
-    return perimeter
-
-
-def gen_unvisited_plot_list(grid: Grid) -> list[Point]:
-    """Returns all of the plot points as a list"""
-    return [
-        (row, col) for row in range(len(grid)) for col in range(len(grid[0]))
-    ]
+    return sum([
+        is_diff(grid, point, neighbor) for neighbor in grid.neighbors(point)
+    ])
 
 
-def get_matching_adjacent_plots(
-    grid: Grid, point: Point, visited: list[Point], queued: list[Point]
-) -> list[Point]:
+@profiled
+def get_matching_adjacent_plots(grid: Grid, point: Point) -> list[Point]:
     """Returns a list of adjacent matching plots"""
-    valid_neighbors = []
-    for neighbor in get_adjacent_plots(point):
-        if is_out_of_bounds(grid, neighbor) or is_diff(grid, point, neighbor):
-            continue
-        valid_neighbors.append(neighbor)
-
-    visited.extend(queued)
     return [
-        neighbor for neighbor in valid_neighbors if neighbor not in visited
+        neighbor for neighbor in grid.neighbors(point)
+        if not is_diff(grid, point, neighbor)
     ]
 
 
-def update_unvisited_plots(
-    unvisited_plots: list[Point], queued_plots: list[Point]
-) -> list[Point]:
-    """
-    Updates the unvisited_plot list by removed plots that have been queued
-    """
-    return [plot for plot in unvisited_plots if plot not in queued_plots]
-
-
-def bfs(grid: Grid) -> dict[int, dict[str, int | str]]:
+def find_regions(grid: Grid) -> Regions:
     """
     Finds all the regions in a grid and returns a dict with each regions
-    plot type, area, and perimeter
+    plot type, area, perimeter and number of corners (its number of sides)
     """
-    unvisited = gen_unvisited_plot_list(grid)
-    visited = []
-    next_plot = unvisited.pop(0)
-
-    queued_plots = get_matching_adjacent_plots(
-        grid, next_plot, visited, [])
-    unvisited = update_unvisited_plots(unvisited, queued_plots)
-
-    region_id = 0
-    plot_dict = {region_id: {}}
-    while next_plot:
-        # Update Region's area & perimeter
-        row, col = next_plot
-        plot_dict[region_id].setdefault('plot', grid[row][col])
-        plot_dict[region_id]['area'] = plot_dict[region_id].get('area', 0) + 1
-        plot_dict[region_id]['perimeter'] = (
-            plot_dict[region_id].get('perimeter', 0)
-            + get_perimeter_per_point(grid, (row, col))
-        )
-        plot_dict[region_id]['corners'] = (
-            plot_dict[region_id].get('corners', 0)
-            + get_num_corners(grid, (row, col))
-        )
-        # Update region if no neighboring plots are left
-        visited.append(next_plot)
-        if len(queued_plots) == 0:
-            region_id += 1
-            plot_dict.setdefault(region_id, {})
-            next_plot = unvisited.pop(0) if len(unvisited) else None
-        else:
-            next_plot = queued_plots.pop(0)
-
-        if next_plot:
-            queued_plots.extend(
-                get_matching_adjacent_plots(
-                    grid, next_plot, visited, queued_plots
-                )
-            )
-            unvisited = update_unvisited_plots(unvisited, queued_plots)
-        print(len(unvisited))
+    def neighbors(point: Point) -> list[Point]:
+        return get_matching_adjacent_plots(grid, point)
+
+    visited = set()
+    plot_dict = {}
+    for start in range(len(grid.cells)):
+        if start in visited or not grid.in_grid(start):
+            continue
+        region = bfs(start, neighbors)
+        visited.update(region)
+        plot_dict[len(plot_dict)] = {
+            'plot': grid[start],
+            'area': len(region),
+            'perimeter': sum([
+                get_perimeter_per_point(grid, point) for point in region
+            ]),
+            'corners': sum([get_num_corners(grid, point) for point in region]),
+        }
+        if TRACING:
+            emit("bfs", region=len(plot_dict) - 1, area=len(region))
     return plot_dict
 
 
@@ -181,13 +112,26 @@ def get_reduced_cost(plot_dict: dict[int, dict[str, int | str]]) -> int:
     ])
 
 
+def parse(data: str) -> Regions:
+    """Returns the plot type, area, perimeter and corners of each region"""
+    plot_dict = find_regions(Grid(split_lines(data)))
+    if TRACING:
+        for region_id, plot in plot_dict.items():
+            emit("region", id=region_id, **plot)
+    return plot_dict
+
+
+def part_1(plot_dict: Regions) -> int:
+    """Returns the cost of fencing every region"""
+    return get_total_fencing_cost(plot_dict)
+
+
+def part_2(plot_dict: Regions) -> int:
+    """Returns the cost of fencing every region with the bulk discount"""
+    return get_reduced_cost(plot_dict)
+
+
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    grid: Grid = extract_data_to_list_of_list(12)
-    plot_dict = bfs(grid)
-    for plot in plot_dict.values():
-        print(plot)
-    sol_1 = get_total_fencing_cost(plot_dict)
-    sol_2 = get_reduced_cost(plot_dict)
-
-    return sol_1, sol_2
+    plot_dict = parse(get_raw_input_stream(12))
+    return part_1(plot_dict), part_2(plot_dict)
@@ -1,24 +1,15 @@
-from utils.utils import extract_data_to_list
+from utils.cache import load_parsed
+from utils.utils import extract_int_records
 
 Point = tuple[int, int]
 Grid = list[list[str | int]]
+# The robot's starting x and y followed by its velocity along x and y
+Robot = tuple[int, int, int, int]
 
 
-def get_start(data: str) -> Point:
-    """Returns the starting point from the given data string"""
-    points = data.split("p=")[1]
-    points = points.split(",")
-    x = points[0]
-    y = points[1].split(" ")[0]
-
-    return int(x), int(y)
-
-
-def get_slope(data: str) -> Point:
-    """Returns the slope in the form of rise over run (i.e., x,y)"""
-    points = data.split("v=")[1]
-    x_change, y_change = points.split(",")
-    return int(x_change), int(y_change)
+def parse(data: str) -> list[Robot]:
+    """Returns the starting point and slope of every robot in the data"""
+    return extract_int_records(data, 4)
 
 
 def solver(initial: Point, slope: Point, time: int) -> Point:
@@ -39,13 +30,13 @@ def grid_position(grid: Grid, point: Point) -> Point:
     return row, col
 
 
-def get_positions(data: list[str], grid: Grid, time: int = 100) -> list[Point]:
+def get_positions(
+    robots: list[Robot], grid: Grid, time: int = 100
+) -> list[Point]:
     """Gets the positions of the robots after time"""
     positions = []
-    for line in data:
-        initial = get_start(line)
-        slope = get_slope(line)
-        abs_position = solver(initial, slope, time)
+    for x, y, x_change, y_change in robots:
+        abs_position = solver((x, y), (x_change, y_change), time)
         rel_position = grid_position(grid, abs_position)
         positions.append(rel_position)
     return positions
@@ -80,12 +71,12 @@ def get_max_seq(grid: Grid) -> int:
     return max_repeats
 
 
-def find_easter_egg(data: list[str]) -> int:
+def find_easter_egg(robots: list[Robot]) -> int:
     """Displays the grid each iteration"""
     frames = {}
     for time in range(10000):
         grid = create_grid(103, 101, default_char=" ")
-        new_positions = get_positions(data, grid, time)
+        new_positions = get_positions(robots, grid, time)
         update_grid(new_positions, grid)
         frames[time] = get_max_seq(grid)
 
@@ -116,20 +107,19 @@ def get_score(grid: Grid) -> int:
     return quads[0] * quads[1] * quads[2] * quads[3]
 
 
-def print_grid(grid: Grid) -> None:
-    """Prints the grid"""
-    for row in grid:
-        for char in row:
-            print(char, end="")
-        print()
+def part_1(robots: list[Robot]) -> int:
+    """Returns the safety factor after 100 seconds"""
+    grid = create_grid(103, 101)
+    update_grid(get_positions(robots, grid), grid)
+    return get_score(grid)
+
+
+def part_2(robots: list[Robot]) -> int:
+    """Returns the number of seconds until the easter egg appears"""
+    return find_easter_egg(robots)
 
 
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    data = extract_data_to_list(14)
-    grid = create_grid(103, 101)
-    update_grid(get_positions(data, grid), grid)
-    sol_1 = get_score(grid)
-    sol_2 = find_easter_egg(data)
-
-    return sol_1, sol_2
+    robots = load_parsed(14, parse)
+    return part_1(robots), part_2(robots)
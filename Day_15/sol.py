@@ -1,74 +1,48 @@
-from utils.utils import extract_data_to_list
+from utils.trace import TRACING, dump_frame
+from utils.utils import Grid, get_raw_input_stream, group_blocks
 
-Grid = list[list[str]]
-Point = tuple[int, int]
-Line = tuple[int, int]
+Point = int  # Flat index of a cell in the Grid
+Warehouse = tuple[Grid, str]
 
+# How each cell of the warehouse is widened in the doubled warehouse
+DOUBLED = str.maketrans({'#': '##', '@': '@.', 'O': '[]', '.': '..'})
 
-def separate_grid_and_moves(data: list[str]) -> tuple[Grid, str]:
-    """Separates the input data into a grid and a string of moves"""
-    grid = []
-    for line in data:
-        if line == '':
-            break
-        grid.append(list(line))
-    moves = ""
-    capture = False
-    for line in data:
-        capture = True if line == '' else capture
-        if capture:
-            moves += line
-    return grid, moves
+
+def parse(data: str) -> Warehouse:
+    """Separates the raw input data into a grid and a string of moves"""
+    grid_lines, *move_blocks = group_blocks(data.splitlines())
+    moves = "".join(line for block in move_blocks for line in block)
+    return Grid(grid_lines), moves
 
 
 def find_start(grid: Grid) -> Point:
     """Finds the @ in the grid"""
-    for row, vals in enumerate(grid):
-        for col, val in enumerate(vals):
-            if val == '@':
-                return row, col
-
-
-def get_val(grid: Grid, point: Point) -> str:
-    """Returns the value at the point in the grid"""
-    row, col = point
-    return grid[row][col]
+    return grid.find('@')
 
 
 def swap_vals(grid: Grid, point_1: Point, point_2: Point) -> None:
     """Swaps the values at point_1 and point_2"""
-    r_1, c_1 = point_1
-    r_2, c_2 = point_2
-    grid[r_1][c_1], grid[r_2][c_2] = grid[r_2][c_2], grid[r_1][c_1]
-
-
-def get_move(move: str) -> Point:
-    """Returns the move in row, col format based on string"""
-    moves = {'^': (-1, 0), '<': (0, -1), '>': (0, 1), 'v': (1, 0)}
-    return moves[move]
+    cells = grid.cells
+    cells[point_1], cells[point_2] = cells[point_2], cells[point_1]
 
 
-def shift_point(point: Point, move: Point) -> Point:
-    """
-    Returns the new point that results from
-    moving point in the given direction
-    """
-    row, col = point
-    row_change, col_change = move
-    return row + row_change, col + col_change
+def get_move(grid: Grid, move: str) -> int:
+    """Returns the change in flat index of the move based on string"""
+    # grid.moves is ordered North, East, South, West
+    return grid.moves['^>v<'.index(move)]
 
 
-def shift_boxes(grid: Grid, curr_pos: Point, move: Point) -> None:
+def shift_boxes(grid: Grid, curr_pos: Point, move: int) -> Point:
     """Moves point and boxes to next available position"""
-    next_pos = shift_point(curr_pos, move)
-    next_pos_val = get_val(grid, next_pos)
+    next_pos = curr_pos + move
+    next_pos_val = grid[next_pos]
 
     if next_pos_val == '.':
         swap_vals(grid, curr_pos, next_pos)
         return next_pos
     elif next_pos_val == 'O':
         shift_boxes(grid, next_pos, move)
-        if get_val(grid, next_pos) == '.':
+        if grid[next_pos] == '.':
             swap_vals(grid, curr_pos, next_pos)
             return next_pos
     return curr_pos
@@ -78,107 +52,83 @@ def follow_moves(grid: Grid, moves: str) -> None:
     """Follows the moves on the grid"""
     pos = find_start(grid)
     for move in moves:
-        act_move = get_move(move)
-        pos = shift_boxes(grid, pos, act_move)
+        pos = shift_boxes(grid, pos, get_move(grid, move))
     return
 
 
-def get_gps(point: Point) -> int:
+def get_gps(grid: Grid, point: Point) -> int:
     """Returns the GPS of the point"""
-    row, col = point
+    row, col = grid.point(point)
     return 100*row+col
 
 
 def get_gps_sum(grid: Grid) -> int:
     """Returns the total gps of all boxes"""
-    total = 0
-    for row, vals in enumerate(grid):
-        for col, val in enumerate(vals):
-            if val == 'O' or val == '[':
-                total += get_gps((row, col))
-    return total
-
-
-def print_grid(grid: Grid):
-    """Print the grid"""
-    for row in grid:
-        for char in row:
-            print(char, end="")
-        print()
-    return
+    return sum([
+        get_gps(grid, point)
+        for point in grid.find_all('O') + grid.find_all('[')
+    ])
 
 
 def double_grid(grid: Grid) -> Grid:
     """Double the grid"""
-    new_grid = []
-    for row in grid:
-        new_row = []
-        for val in row:
-            if val == '#':
-                new_row.extend(['#', '#'])
-            elif val == '@':
-                new_row.extend(['@', '.'])
-            elif val == 'O':
-                new_row.extend(['[', ']'])
-            else:
-                new_row.extend(['.', '.'])
-        new_grid.append(new_row)
-    return new_grid
-
-
-def shift_box_horizontal(grid: Grid, row: int, start: int, end: int) -> None:
+    return Grid([row.translate(DOUBLED) for row in grid.rows()])
+
+
+def shift_box_horizontal(grid: Grid, start: Point, end: Point) -> None:
     """
     Continues to shift boxes horizontally until the
     free space is the start
     """
-
     direction = 1 if end < start else -1
-    col = end
+    point = end
 
-    while col != start:
-        next_col = col + direction
-        grid[row][col], grid[row][next_col] = (
-            grid[row][next_col], grid[row][col]
-        )
-        col = next_col
+    while point != start:
+        next_point = point + direction
+        swap_vals(grid, point, next_point)
+        point = next_point
     return
 
 
-def find_horizontal_free_space(grid: Grid, pos: Point, direction: str) -> int:
+def find_horizontal_free_space(
+    grid: Grid, pos: Point, direction: str
+) -> Point:
     """Returns the next available free space or -1 if not found"""
-    row, col = pos
     direction = -1 if direction == '<' else 1
 
-    # Keep incrementing col until '[' or ']' is not in the space
-    col += direction
-    while get_val(grid, (row, col)) in ['[', ']']:
-        col += direction
+    # Keep moving until '[' or ']' is not in the space
+    point = pos + direction
+    while grid[point] in ('[', ']'):
+        point += direction
 
-    # If a free space is found at row, col, return the col value
-    if get_val(grid, (row, col)) == '.':
-        return col
+    # If a free space is found at point, return it
+    if grid[point] == '.':
+        return point
     return -1
 
 
-def check_space_above(grid: Grid, row: int, col: int, direction: int) -> bool:
-    """Check if vertical movement is clear"""
-    next_row = row + direction
-    curr_val = get_val(grid, (row, col))
-    next_val = get_val(grid, (next_row, col))
+def check_space_above(grid: Grid, point: Point, direction: int) -> bool:
+    """
+    Check if vertical movement is clear. direction is the change in flat
+    index of one row up or down.
+    """
+    next_point = point + direction
+    curr_val = grid[point]
+    next_val = grid[next_point]
 
     availability = []
     if next_val == '[' and curr_val != next_val:
-        availability.append(check_space_above(grid, next_row, col, direction))
+        availability.append(check_space_above(grid, next_point, direction))
         availability.append(
-            check_space_above(grid, next_row, col+1, direction)
+            check_space_above(grid, next_point + 1, direction)
         )
     elif next_val == ']' and curr_val != next_val:
-        availability.append(check_space_above(grid, next_row, col, direction))
+        availability.append(check_space_above(grid, next_point, direction))
         availability.append(
-            check_space_above(grid, next_row, col-1, direction)
+            check_space_above(grid, next_point - 1, direction)
         )
     elif next_val == curr_val:
-        availability.append(check_space_above(grid, next_row, col, direction))
+        availability.append(check_space_above(grid, next_point, direction))
     elif next_val == '#':
         availability.append(False)
     else:
@@ -189,40 +139,35 @@ def check_space_above(grid: Grid, row: int, col: int, direction: int) -> bool:
     return True
 
 
-def shift_up(grid: Grid, row: int, col: int, direction: int) -> None:
+def shift_up(grid: Grid, point: Point, direction: int) -> None:
     """Shift spaces vertically"""
-    next_row = row + direction
-    curr_val = get_val(grid, (row, col))
-    next_val = get_val(grid, (next_row, col))
+    next_point = point + direction
+    curr_val = grid[point]
+    next_val = grid[next_point]
 
     if next_val == '[' and curr_val != next_val:
-        shift_up(grid, next_row, col, direction)
-        shift_up(grid, next_row, col+1, direction)
+        shift_up(grid, next_point, direction)
+        shift_up(grid, next_point + 1, direction)
 
     elif next_val == ']' and curr_val != next_val:
-        shift_up(grid, next_row, col, direction)
-        shift_up(grid, next_row, col-1, direction)
+        shift_up(grid, next_point, direction)
+        shift_up(grid, next_point - 1, direction)
 
     elif next_val == curr_val:
-        shift_up(grid, next_row, col, direction)
+        shift_up(grid, next_point, direction)
 
-    grid[row][col], grid[next_row][col] = (
-        grid[next_row][col], grid[row][col]
-    )
+    swap_vals(grid, point, next_point)
 
 
 def do_double_move(grid: Grid, curr_pos: Point, move: str):
-    row, col = curr_pos
     if move == '<' or move == '>':
         next_free_space = find_horizontal_free_space(grid, curr_pos, move)
-        if next_free_space > 0:
-            shift_box_horizontal(grid, row, col, next_free_space)
-    elif move == 'v':
-        if check_space_above(grid, row, col, direction=1):
-            shift_up(grid, row, col, direction=1)
+        if next_free_space != -1:
+            shift_box_horizontal(grid, curr_pos, next_free_space)
     else:
-        if check_space_above(grid, row, col, direction=-1):
-            shift_up(grid, row, col, direction=-1)
+        direction = get_move(grid, move)
+        if check_space_above(grid, curr_pos, direction):
+            shift_up(grid, curr_pos, direction)
     return
 
 
@@ -231,20 +176,27 @@ def follow_moves_on_double_map(grid: Grid, moves: str) -> None:
     for move in moves:
         do_double_move(grid, pos, move)
         pos = find_start(grid)
-    print_grid(grid)
+    if TRACING:
+        dump_frame("Day 15 doubled warehouse", str(grid))
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    data = extract_data_to_list(15)
-    grid, moves = separate_grid_and_moves(data)
+def part_1(warehouse: Warehouse) -> int:
+    """Returns the sum of the boxes' GPS coordinates after the moves"""
+    grid, moves = warehouse
+    grid = grid.copy()
     follow_moves(grid, moves)
-    sol_1 = get_gps_sum(grid)
+    return get_gps_sum(grid)
+
 
-    data = extract_data_to_list(15)
-    grid, moves = separate_grid_and_moves(data)
+def part_2(warehouse: Warehouse) -> int:
+    """Returns the sum of the GPS coordinates in the doubled warehouse"""
+    grid, moves = warehouse
     new_grid = double_grid(grid)
     follow_moves_on_double_map(new_grid, moves)
-    sol_2 = get_gps_sum(new_grid)
+    return get_gps_sum(new_grid)
+
 
-    return sol_1, sol_2
+def solution() -> tuple[int, int]:
+    """Returns a solution as a tuple of ints"""
+    warehouse = parse(get_raw_input_stream(15))
+    return part_1(warehouse), part_2(warehouse)
@@ -1,5 +1,5 @@
 from typing import Callable
-from utils.utils import extract_data_to_list
+from utils.utils import get_raw_input_stream, split_lines
 
 Registers = dict[str, int]
 Operation = Callable[[Registers, int, int], int]
@@ -155,12 +155,24 @@ def find_A(data: list[str], stack: Stack) -> None:
     return sum([digits[i]*(8**(i)) for i in range(len(stack))])
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    data = extract_data_to_list(17)
+def parse(data: str) -> list[str]:
+    """Returns the lines describing the registers and the program"""
+    return split_lines(data)
+
+
+def part_1(data: list[str]) -> str:
+    """Returns the output of the program joined by commas"""
     registers = init_registers(data)
-    program_instructions = get_program_stack(data)
-    run_program(registers, program_instructions)
-    sol_1 = ",".join(map(str, registers['Output']))
-    sol_2 = find_A(data, program_instructions)
-    return sol_1, sol_2
+    run_program(registers, get_program_stack(data))
+    return ",".join(map(str, registers['Output']))
+
+
+def part_2(data: list[str]) -> int:
+    """Returns the lowest value for A that makes the program output itself"""
+    return find_A(data, get_program_stack(data))
+
+
+def solution() -> tuple[str, int]:
+    """Returns a solution as a tuple of a string and an int"""
+    data = parse(get_raw_input_stream(17))
+    return part_1(data), part_2(data)
@@ -1,4 +1,8 @@
-from utils.utils import extract_data_to_list
+from utils.memo import memoize
+from utils.utils import get_raw_input_stream, split_lines
+
+# The designs to make and the available towel patterns
+Towels = tuple[list[str], list[str]]
 
 
 def get_available_patterns(data: list[str]) -> list[str]:
@@ -9,21 +13,20 @@ def get_available_patterns(data: list[str]) -> list[str]:
     return sorted(patterns, key=lambda pattern: len(pattern), reverse=True)
 
 
-def get_num_solutions(
-    design: str, patterns: list[str], cache: dict[str, int]
-) -> None:
+@memoize(key=lambda design, patterns: design)
+def get_num_solutions(design: str, patterns: list[str]) -> int:
     """
-    Updates the cache the number of possible combinations to create the
-    given design
+    Returns the number of possible combinations to create the given design.
+    Results are cached by design alone, so the cache must be cleared before
+    switching to other patterns.
     """
-    if cache.get(design) is None:
-        cache[design] = 0
-        for pattern in patterns:
-            if design.startswith(pattern):
-                cache[design] += get_num_solutions(
-                    design.removeprefix(pattern), patterns, cache
-                )
-    return cache[design]
+    if not design:
+        return 1
+    total = 0
+    for pattern in patterns:
+        if design.startswith(pattern):
+            total += get_num_solutions(design[len(pattern):], patterns)
+    return total
 
 
 def find_solutions(designs: list[str], patterns: list[str]) -> int:
@@ -31,17 +34,31 @@ def find_solutions(designs: list[str], patterns: list[str]) -> int:
     Returns total number of possible designs and the number of combinations to
     create the designs with the given patterns
     """
-    cache = {'': 1}
-    for design in designs:
-        get_num_solutions(design, patterns, cache)
+    get_num_solutions.cache_clear()
+    combinations = [get_num_solutions(design, patterns) for design in designs]
 
-    possible_solutions = sum([1 for design in designs if cache[design] > 0])
-    num_combinations = sum([cache[design] for design in designs])
+    possible_solutions = sum([1 for num in combinations if num > 0])
+    num_combinations = sum(combinations)
     return possible_solutions, num_combinations
 
 
+def parse(data: str) -> Towels:
+    """Returns the designs and the patterns sorted longest first"""
+    designs = split_lines(data)
+    patterns = get_available_patterns(designs)
+    return designs, patterns
+
+
+def part_1(towels: Towels) -> int:
+    """Returns the number of designs that are possible"""
+    return find_solutions(*towels)[0]
+
+
+def part_2(towels: Towels) -> int:
+    """Returns the number of ways every design can be made"""
+    return find_solutions(*towels)[1]
+
+
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    designs = extract_data_to_list(19)
-    patterns = get_available_patterns(designs)
-    return find_solutions(designs, patterns)
+    return find_solutions(*parse(get_raw_input_stream(19)))
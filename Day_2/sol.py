@@ -1,15 +1,17 @@
-from utils.utils import extract_data_to_list
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, Iterator
 
+from utils.utils import iter_lines
+
+# NumPy is only imported by the vectorized functions that need it
+if TYPE_CHECKING:
+    import numpy as np
 
-def convert_to_ints(data: list[str]) -> list[list[int]]:
-    """
-    Converts the input from a list of strings to a list of a list of ints
-    """
 
-    converted_data = []
+def convert_to_ints(data: Iterable[str]) -> Iterator[list[int]]:
+    """Converts each line of the input into a list of ints"""
     for line in data:
-        converted_data.append([int(num) for num in line.split(" ")])
-    return converted_data
+        yield [int(num) for num in line.split(" ")]
 
 
 def calc_diff(data: list[int]) -> list[int]:
@@ -23,15 +25,6 @@ def calc_diff(data: list[int]) -> list[int]:
     return seq_diff
 
 
-def create_diff_array(data: list[list[int]]) -> list[list[int]]:
-    """Returns a list of difference lists"""
-    diff = []
-    # Iterate through each sequence of numbers
-    for seq in data:
-        diff.append(calc_diff(seq))
-    return diff
-
-
 def safely_changing(data: list[int], lower: int, upper: int) -> bool:
     """
     Returns the true if the number of difference within the bounds is 
@@ -40,42 +33,133 @@ def safely_changing(data: list[int], lower: int, upper: int) -> bool:
     return len(data) == len([x for x in data if (lower <= x <= upper)])
 
 
-def is_tolerable(data: list[int]) -> bool:
+def count_removals(
+    data: list[int], lower: int, upper: int, max_removals: int
+) -> int:
+    """
+    Returns the fewest levels that have to be removed so every step between
+    the remaining levels is within the bounds, or max_removals + 1 if more
+    than max_removals are needed. removals[idx] holds the fewest removals
+    that keep idx as the last level so far, which only depends on the
+    max_removals + 1 levels before it, making this O(n * max_removals).
+    """
+    too_many = max_removals + 1
+    removals = []
+    # Removing every level is always allowed
+    fewest = len(data)
+    for idx, level in enumerate(data):
+        best = idx
+        for prev in range(max(idx - too_many, 0), idx):
+            if lower <= data[prev] - level <= upper:
+                best = min(best, removals[prev] + idx - prev - 1)
+        removals.append(best)
+        fewest = min(fewest, best + len(data) - idx - 1)
+    return min(fewest, too_many)
+
+
+def is_tolerable(data: list[int], max_removals: int = 1) -> bool:
+    """
+    Returns true if data becomes safe after removing at most max_removals
+    levels
+    """
+    return (
+        count_removals(data, 1, 3, max_removals) <= max_removals
+        or count_removals(data, -3, -1, max_removals) <= max_removals
+    )
+
+
+def is_safe(report: list[int]) -> bool:
+    """Returns true if the report steadily increases or decreases"""
+    diff = calc_diff(report)
+    return safely_changing(diff, 1, 3) or safely_changing(diff, -3, -1)
+
+
+def find_safe_rows(reports: "np.ndarray") -> "np.ndarray":
+    """
+    Returns a boolean array marking the safe rows of a 2-D array of
+    reports that all have the same length
+    """
+    import numpy as np
+
+    diff = -np.diff(reports, axis=1)
+    return (
+        ((diff >= 1) & (diff <= 3)).all(axis=1)
+        | ((diff >= -3) & (diff <= -1)).all(axis=1)
+    )
+
+
+def determine_safe_reports_batched(
+    data: Iterable[list[int]], max_removals: int = 1
+) -> tuple[int, int]:
     """
-    Returns true if data only contains one valid that makes it unsafe.
-    Currently implements a brute force solution.
+    Returns the same counts as determine_safe_reports. Reports of equal
+    length are packed into 2-D arrays and checked together, and only the
+    unsafe rows are checked for tolerance one at a time.
     """
-    for skipped_idx in range(len(data)):
-        temp = []
-        for idx in range(len(data)):
-            if idx != skipped_idx:
-                temp.append(data[idx])
-        temp = calc_diff(temp)
-        if safely_changing(temp, 1, 3) or safely_changing(temp, -3, -1):
-            return True
-    return False
-
-
-def determine_safe_reports(data: list[list[int]]) -> tuple[int, int]:
+    import numpy as np
+
+    by_length = defaultdict(list)
+    for seq in data:
+        by_length[len(seq)].append(seq)
+
+    total = 0
+    tolerable = 0
+    for seqs in by_length.values():
+        reports = np.array(seqs, dtype=np.int64)
+        safe = find_safe_rows(reports)
+        total += int(safe.sum())
+        for report in reports[~safe].tolist():
+            tolerable += is_tolerable(report, max_removals)
+
+    return total, tolerable+total
+
+
+def determine_safe_reports(
+    data: Iterable[list[int]], max_removals: int = 1,
+    vectorized: bool = False
+) -> tuple[int, int]:
     """
     Returns the number of sequences that do not oscillate and
     do not change by more than 2 at any given step along with the number
-    of sequences that are tolerable.
+    of sequences that are tolerable (safe after removing at most
+    max_removals levels). Reports are checked one at a time so data can be
+    a stream, unless vectorized is true, which checks them in NumPy
+    batches instead.
     """
+    if vectorized:
+        return determine_safe_reports_batched(data, max_removals)
+
     total = 0
     tolerable = 0
-    differences = create_diff_array(data)
 
-    for seq, diff in zip(data, differences):
-        if safely_changing(diff, 1, 3) or safely_changing(diff, -3, -1):
+    for seq in data:
+        if is_safe(seq):
             total += 1
-        elif is_tolerable(seq):
+        elif is_tolerable(seq, max_removals):
             tolerable += 1
 
     return total, tolerable+total
 
 
-def solution() -> tuple[int, int]:
-    data = convert_to_ints(extract_data_to_list(2))
-    num_safe_reports, tolerable_reports = determine_safe_reports(data)
+def parse(data: str) -> list[list[int]]:
+    """Returns the levels of each report in the data"""
+    return list(convert_to_ints(data.splitlines()))
+
+
+def part_1(reports: list[list[int]]) -> int:
+    """Returns the number of safe reports"""
+    return sum([is_safe(report) for report in reports])
+
+
+def part_2(reports: list[list[int]]) -> int:
+    """Returns the number of reports that are safe or tolerable"""
+    return determine_safe_reports(reports)[1]
+
+
+def solution(vectorized: bool = False) -> tuple[int, int]:
+    """Returns a solution as a tuple of ints"""
+    data = convert_to_ints(iter_lines(2))
+    num_safe_reports, tolerable_reports = determine_safe_reports(
+        data, vectorized=vectorized
+    )
     return num_safe_reports, tolerable_reports
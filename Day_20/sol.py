@@ -1,74 +1,33 @@
-from utils.utils import extract_data_to_list
+from utils.search import bfs
+from utils.utils import Grid, get_raw_input_stream, split_lines
 
-Grid = list[list[str]]
-Point = tuple[int, int]
+Point = int  # Flat index of a cell in the Grid
 Cheat = tuple[Point, Point, Point]
+# The racetrack and the distance from each point on the track to E
+Track = tuple[Grid, dict[Point, int]]
 
+# The longest cheat. The grid is padded this deep so the flat index offset
+# of every cheat is unique and never wraps into another row.
+CHEAT_RADIUS = 20
 
-def print_grid(grid: Grid, pos: Point = (-1, -1)) -> None:
-    """Prints the grid"""
-    for row, vals in enumerate(grid):
-        for col, val in enumerate(vals):
-            print('o', end='') if (row, col) == pos else print(val, end='')
-        print()
-    return
 
-
-def create_grid(data: list[str]) -> Grid:
-    """Returns a grid from the data"""
-    return [[val for val in row] for row in data]
-
-
-def find_start(grid: Grid) -> Point:
-    for row, vals in enumerate(grid):
-        for col, val in enumerate(vals):
-            if val == 'S':
-                return row, col
-
-
-def get_val(grid: Grid, point: Point) -> str:
-    """Returns the value at the point"""
-    row, col = point
-    return grid[row][col]
-
-
-def add_points(point_1: Point, point_2: Point) -> Point:
-    """Return the addition of the two given tuples"""
-    r_1, c_1 = point_1
-    r_2, c_2 = point_2
-    return r_1 + r_2, c_1 + c_2
-
-
-def is_in_bounds(grid: Grid, point: Point) -> bool:
-    """Returns true if point is on the grid"""
-    row, col = point
-    return 0 <= row < len(grid) and 0 <= col < len(grid[0])
-
-
-def get_all_neighbors(grid: Grid, point: Point) -> list[Point]:
-    """Return a list of all neighbors"""
-    neighbors = []
-    for move in [(-1, 0), (0, 1), (1, 0), (0, -1)]:
-        neighbor = add_points(point, move)
-        if is_in_bounds(grid, neighbor):
-            neighbors.append(add_points(point, move))
-    return neighbors
+def is_track(grid: Grid, point: Point) -> bool:
+    """Returns true if point is on the grid and not a wall"""
+    return grid.in_grid(point) and grid[point] != '#'
 
 
 def get_jumps(grid: Grid, point: Point) -> list[Cheat]:
     """Returns all cheats from a particular point"""
-    neighbors = get_all_neighbors(grid, point)
     cheats = []
-    for neighbor in neighbors:
-        if get_val(grid, neighbor) == '#':
-            jumps = get_all_neighbors(grid, neighbor)
-            for jump in jumps:
-                if jump != point and get_val(grid, jump) != '#':
+    for neighbor in grid.neighbors(point):
+        if grid[neighbor] == '#':
+            for jump in grid.neighbors(neighbor):
+                if jump != point and is_track(grid, jump):
                     cheats.append((point, neighbor, jump))
     return cheats
 
 
-def get_all_cheats(grid: Grid, path: dict[Point, int]) -> set(Cheat):
+def get_all_cheats(grid: Grid, path: dict[Point, int]) -> set[Cheat]:
     """Returns all the available cheats"""
     cheats = []
     for point in path.keys():
@@ -76,54 +35,38 @@ def get_all_cheats(grid: Grid, path: dict[Point, int]) -> set(Cheat):
     return set(cheats)
 
 
-def get_next_valid_move(
-    grid: Grid, point: Point, visited: dict[Point, int]
-) -> Point:
-    """Return next valid move"""
-    neighbors = get_all_neighbors(grid, point)
-    for neighbor in neighbors:
-        if visited.get(neighbor) or get_val(grid, neighbor) == '#':
-            continue
-        return neighbor
+def get_cheat_offsets(
+    grid: Grid, radius: int = CHEAT_RADIUS
+) -> list[tuple[int, int]]:
+    """
+    Returns the flat index offset and the length of every cheat of at most
+    radius moves
+    """
+    offsets = []
+    for row_diff in range(-radius, radius + 1):
+        for col_diff in range(-radius, radius + 1):
+            distance = abs(row_diff) + abs(col_diff)
+            if distance <= radius:
+                offsets.append((row_diff * grid.stride + col_diff, distance))
+    return offsets
 
 
 def expanded_cheats(
-    grid: Grid, point: Point
+    grid: Grid, point: Point, offsets: list[tuple[int, int]]
 ) -> list[tuple[Point, Point, int]]:
     """Return a list of accessible points that within 20 moves"""
-    row, col = point
-    cheats = {}
-    for row_diff in range(-20, 21):
-        for col_diff in range(-20, 21):
-            distance = abs(row_diff) + abs(col_diff)
-            if distance > 20:
-                continue
-            target = add_points(point, (row_diff, col_diff))
-            if is_in_bounds(grid, target) and get_val(grid, target) != '#':
-                cheats[(point, target)] = min(
-                    distance, cheats.get((point, target), 21)
-                )
-    unique_cheats = []
-    for cheat, distance in cheats.items():
-        start, target = cheat
-        unique_cheats.append((start, target, distance))
-    return unique_cheats
-
-
-def find_path(grid: Grid, curr_pos: Point) -> list[Point]:
-    """Finds the path and saves the distance from the end at each point"""
-    path = [curr_pos]
-    visited = {curr_pos: True}
-    if visited is None:
-        visited[curr_pos] = True
-    next_pos = get_next_valid_move(grid, curr_pos, visited)
-
-    while get_val(grid, curr_pos) != 'E':
-        curr_pos = next_pos
-        visited[curr_pos] = True
-        path.append(curr_pos)
-        next_pos = get_next_valid_move(grid, curr_pos, visited)
-    return path
+    return [
+        (point, point + offset, distance) for offset, distance in offsets
+        if is_track(grid, point + offset)
+    ]
+
+
+def get_track_neighbors(grid: Grid, point: Point) -> list[Point]:
+    """Return the neighbors of point that are on the track"""
+    return [
+        neighbor for neighbor in grid.neighbors(point)
+        if is_track(grid, neighbor)
+    ]
 
 
 def get_pos_values(grid: Grid) -> dict[Point, int]:
@@ -131,15 +74,20 @@ def get_pos_values(grid: Grid) -> dict[Point, int]:
     Returns a dictionary with each point on the path and its distance to
     E
     """
-    start = find_start(grid)
-    path = find_path(grid, start)
-    return dict(zip(path, range(len(path) - 1, -1, -1)))
+    end = grid.find('E')
+    return bfs(end, lambda point: get_track_neighbors(grid, point))
+
 
+def parse(data: str) -> Track:
+    """Returns the racetrack along with the distance of each point to E"""
+    grid = Grid(split_lines(data), padding=CHEAT_RADIUS)
+    return grid, get_pos_values(grid)
 
-def solution_1(grid: Grid) -> int:
-    """Returns solution 1"""
+
+def part_1(track: Track) -> int:
+    """Returns the number of 2 picosecond cheats saving at least 100"""
     sol = {}
-    pos_vals = get_pos_values(grid)
+    grid, pos_vals = track
     cheats = get_all_cheats(grid, pos_vals)
     for start, wall, end in cheats:
         time_saved = pos_vals[start] - pos_vals[end] - 2
@@ -148,16 +96,16 @@ def solution_1(grid: Grid) -> int:
     return sum([freq for time_saved, freq in sol.items() if time_saved >= 100])
 
 
-def solution_2(grid: Grid) -> int:
-    """Returns solution 2"""
+def part_2(track: Track) -> int:
+    """Returns the number of 20 picosecond cheats saving at least 100"""
     sol = {}
-    pos_vals = get_pos_values(grid)
+    grid, pos_vals = track
+    offsets = get_cheat_offsets(grid)
     cheats = []
     for point in pos_vals.keys():
-        cheats.extend(expanded_cheats(grid, point))
-    unique_cheats = set(cheats)
+        cheats.extend(expanded_cheats(grid, point, offsets))
 
-    for start, end, distance in unique_cheats:
+    for start, end, distance in cheats:
         time_saved = pos_vals[start] - pos_vals[end] - distance
         if time_saved > 0:
             sol[time_saved] = sol.get(time_saved, 0) + 1
@@ -166,8 +114,5 @@ def solution_2(grid: Grid) -> int:
 
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    grid = create_grid(extract_data_to_list(20))
-    sol_1 = solution_1(grid)
-    sol_2 = solution_2(grid)
-
-    return sol_1, sol_2
+    track = parse(get_raw_input_stream(20))
+    return part_1(track), part_2(track)
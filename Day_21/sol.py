@@ -1,5 +1,7 @@
 from itertools import permutations, product
-from utils.utils import extract_data_to_list
+
+from utils.memo import memoize
+from utils.utils import get_raw_input_stream, split_lines
 
 
 Point = tuple[int, int]
@@ -127,19 +129,18 @@ def build_key_sequence(
         )
 
 
-def shortest_sequence(btns, depth, cache, best_key_pad_paths):
+@memoize(key=lambda btns, depth, best_key_pad_paths: (btns, depth))
+def shortest_sequence(btns, depth, best_key_pad_paths):
     """
     Returns the length of the of shortest sequence of buttons that need to be
-    input at depth to achieve the given input (btns)
+    input at depth to achieve the given input (btns). The key pad paths are
+    the same for every input, so they are left out of the cache key.
     """
 
     # base case
     if depth == 0:
         return len(btns)
 
-    if (btns, depth) in cache:
-        return cache[(btns, depth)]
-
     subs = [sub + 'A' for sub in btns.split('A')][:-1]
     total_len = 0
     for sub in subs:
@@ -148,10 +149,9 @@ def shortest_sequence(btns, depth, cache, best_key_pad_paths):
         seq_lens = []
         for seq in seq_list:
             seq_lens.append(
-                shortest_sequence(seq, depth-1, cache, best_key_pad_paths)
+                shortest_sequence(seq, depth-1, best_key_pad_paths)
             )
         total_len += min(seq_lens)
-    cache[(btns, depth)] = total_len
     return total_len
 
 
@@ -159,10 +159,10 @@ def solve(codes: list[str], depth: int):
     """
     Harness function
     """
-
+    # Every call starts from an empty cache so repeated runs redo the work
+    shortest_sequence.cache_clear()
     best_num_pad_paths = calc_shortest_number_pad_path()
     best_key_pad_paths = calc_shortest_key_pad_path()
-    cache = {}
     total = 0
     for code in codes:
         seq_list = []
@@ -171,13 +171,28 @@ def solve(codes: list[str], depth: int):
         seq_lens = []
         for seq in seq_list:
             seq_lens.append(
-                shortest_sequence(seq, depth, cache, best_key_pad_paths)
+                shortest_sequence(seq, depth, best_key_pad_paths)
             )
         total += int(code[:-1])*min(seq_lens)
     return total
 
 
+def parse(data: str) -> list[str]:
+    """Returns the codes to type"""
+    return split_lines(data)
+
+
+def part_1(codes: list[str]) -> int:
+    """Returns the sum of the complexities with 2 robot keypads"""
+    return solve(codes, 2)
+
+
+def part_2(codes: list[str]) -> int:
+    """Returns the sum of the complexities with 25 robot keypads"""
+    return solve(codes, 25)
+
+
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    codes = extract_data_to_list(21)
-    return solve(codes, 2), solve(codes, 25)
+    codes = parse(get_raw_input_stream(21))
+    return part_1(codes), part_2(codes)
@@ -1,4 +1,6 @@
-from utils.utils import extract_data_to_list
+from typing import Iterable
+
+from utils.utils import extract_ints, iter_lines
 
 Deltas = tuple[int, int, int, int]
 
@@ -41,7 +43,7 @@ def gen_prices(secret: int) -> list[int]:
     return prices
 
 
-def gen_delta_map(prices: list[int]) -> dict[Deltas, tuple[int, int]]:
+def gen_delta_map(prices: list[int]) -> dict[Deltas, int]:
 
     deltas = [
         prices[1] - prices[0],
@@ -59,26 +61,53 @@ def gen_delta_map(prices: list[int]) -> dict[Deltas, tuple[int, int]]:
     return delta_map
 
 
-def get_solution_2(seeds: list[int]):
-    """TODO"""
+def add_delta_map(
+    totals: dict[Deltas, int], delta_map: dict[Deltas, int]
+) -> None:
+    """Adds the price each sequence of changes sells at to the totals"""
+    for deltas, price in delta_map.items():
+        totals[deltas] = totals.get(deltas, 0) + price
+
+
+def get_solution_2(seeds: Iterable[int]) -> int:
+    """
+    Returns the most bananas a single sequence of changes can buy. Only the
+    running total of each sequence is kept rather than every buyer's map.
+    """
+    totals = {}
+    for seed in seeds:
+        add_delta_map(totals, gen_delta_map(gen_prices(seed)))
+    return max(totals.values())
+
 
-    delta_maps = []
+def solve_seeds(seeds: Iterable[int]) -> tuple[int, int]:
+    """
+    Returns the answers to both parts in one pass over the seeds, so they
+    can be streamed without being stored
+    """
+    total = 0
+    totals = {}
     for seed in seeds:
-        delta_maps.append(gen_delta_map(gen_prices(seed)))
+        total += get_2000th_secret(seed)
+        add_delta_map(totals, gen_delta_map(gen_prices(seed)))
+    return total, max(totals.values())
+
+
+def parse(data: str) -> list[int]:
+    """Returns the initial secret number of each buyer"""
+    return list(extract_ints(data))
+
+
+def part_1(seeds: list[int]) -> int:
+    """Returns the sum of each buyer's 2000th secret number"""
+    return get_solution_1(seeds)
 
-    unique_deltas = set(
-        [key for delta_map in delta_maps for key in delta_map.keys()]
-    )
 
-    banana_prices = []
-    for unique_delta in unique_deltas:
-        banana_prices.append(
-            sum([delta_map.get(unique_delta, 0) for delta_map in delta_maps])
-        )
-    return max(banana_prices)
+def part_2(seeds: list[int]) -> int:
+    """Returns the most bananas a single sequence of changes can buy"""
+    return get_solution_2(seeds)
 
 
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    seeds = [int(num) for num in extract_data_to_list(22)]
-    return get_solution_1(seeds), get_solution_2(seeds)
+    return solve_seeds(int(line) for line in iter_lines(22) if line)
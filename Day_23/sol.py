@@ -1,4 +1,4 @@
-from utils.utils import extract_data_to_list
+from utils.utils import get_raw_input_stream, split_lines
 
 
 Network = dict[str, list[str]]
@@ -34,6 +34,7 @@ def get_matching_parties(network: Network) -> int:
 def get_maximal_cliques(network: Network) -> int:
     """Returns the maximal cliques using the Bron-Kerbosch algorithm"""
     parties = set()
+    adjacent = {node: set(neighbors) for node, neighbors in network.items()}
 
     def Bron_Kerbosch(party: set[str], nodes: set[str], excluded: set[str]):
         """Bron-Kerbosch algorithm with pivoting"""
@@ -42,17 +43,15 @@ def get_maximal_cliques(network: Network) -> int:
             return
 
         pivot = next(iter(nodes.union(excluded)))
-        for vertex in nodes.difference(network[pivot]):
+        for vertex in nodes.difference(adjacent[pivot]):
             Bron_Kerbosch(
                 party.union({vertex}),
-                nodes.intersection(network[vertex]),
-                excluded.intersection(network[vertex])
+                nodes.intersection(adjacent[vertex]),
+                excluded.intersection(adjacent[vertex])
             )
             nodes.remove(vertex)
             excluded.add(vertex)
 
-    for node in network:
-        network[node] = set(network[node])
     Bron_Kerbosch(set(), set(network.keys()), set())
     return parties
 
@@ -67,11 +66,23 @@ def get_largest_party(network: Network) -> str:
     return ','.join(largest_party)
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    connections = [
-        tuple(nodes.split('-')) for nodes in extract_data_to_list(23)
-    ]
-    network = generate_network(connections)
+def parse(data: str) -> Network:
+    """Returns the network described by the connections in the data"""
+    connections = [tuple(nodes.split('-')) for nodes in split_lines(data)]
+    return generate_network(connections)
 
-    return get_matching_parties(network), get_largest_party(network)
+
+def part_1(network: Network) -> int:
+    """Returns the number of parties of three with a t computer"""
+    return get_matching_parties(network)
+
+
+def part_2(network: Network) -> str:
+    """Returns the password of the largest party"""
+    return get_largest_party(network)
+
+
+def solution() -> tuple[int, str]:
+    """Returns a solution as a tuple of an int and a string"""
+    network = parse(get_raw_input_stream(23))
+    return part_1(network), part_2(network)
@@ -1,11 +1,12 @@
 from typing import Callable
-from utils.utils import extract_data_to_list
+from utils.utils import get_raw_input_stream, split_lines
 
 
 Wires = tuple[str, str, str]
 Gate = Callable[[str, str, str, dict[str, int]], None]
 Circuit = list[tuple[Wires, Gate]]
 Circuit_Map = dict[str, tuple[str, str, Gate]]
+Device = tuple[dict[str, int], Circuit]
 
 
 def AND(w1: str, w2: str, w3: str, wire_vals: dict[str, int]) -> None:
@@ -182,10 +183,26 @@ def get_solution_2(circuit_map: Circuit_Map):
     return ','.join(sorted(swaps))
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    wire_vals, circuit = init_circuit(extract_data_to_list(24))
+def parse(data: str) -> Device:
+    """Returns the initial values of the wires and the circuit"""
+    return init_circuit(split_lines(data))
+
+
+def part_1(device: Device) -> int:
+    """Returns the number output on the z wires"""
+    wire_vals, circuit = device
+    wire_vals = wire_vals.copy()
     start_circuit(wire_vals, circuit)
-    return (
-        get_solution_1(wire_vals), get_solution_2(create_circuit_dict(circuit))
-    )
+    return get_solution_1(wire_vals)
+
+
+def part_2(device: Device) -> str:
+    """Returns the sorted names of the swapped wires"""
+    _, circuit = device
+    return get_solution_2(create_circuit_dict(circuit))
+
+
+def solution() -> tuple[int, str]:
+    """Returns a solution as a tuple of an int and a string"""
+    device = parse(get_raw_input_stream(24))
+    return part_1(device), part_2(device)
@@ -1,12 +1,15 @@
-from utils.utils import extract_data_to_list
+from typing import Iterable
+
+from utils.utils import group_blocks, iter_blocks
 
 
 Pin_Height = tuple[int, ...]
 Keys = list[Pin_Height]
 Locks = list[Pin_Height]
+Schematics = tuple[Keys, Locks]
 
 
-def get_pin_height(schematic: list[list[str]]) -> Pin_Height:
+def get_pin_height(schematic: list[str]) -> Pin_Height:
     """Returns the pin height of the given schematic"""
     pin_heights = [-1] * len(schematic[0])
     for vals in schematic:
@@ -15,30 +18,19 @@ def get_pin_height(schematic: list[list[str]]) -> Pin_Height:
     return tuple(pin_heights)
 
 
-def create_key_or_lock(
-    locks: Locks, keys: Keys, schematic: list[list[str]]
-) -> None:
+def create_keys_and_locks(
+    schematics: Iterable[list[str]]
+) -> tuple[Keys, Locks]:
     """
-    Appends the pin height of the schematic to either the keys or locks
-    depending on the schematic's first value
+    Returns the keys and locks from the input schematics. Schematics whose
+    first value is '#' are locks, the others are keys.
     """
-    if schematic[0][0] == '#':
-        locks.append(get_pin_height(schematic))
-    else:
-        keys.append(get_pin_height(schematic))
-    schematic.clear()
-
-
-def create_keys_and_locks(data: list[str]) -> tuple[Keys, Locks]:
-    """Returns the keys and locks from the input data"""
-
-    schematic, locks, keys = [], [], []
-    for row in data:
-        if not row:
-            create_key_or_lock(locks, keys, schematic)
-            continue
-        schematic.append(list(row))
-    create_key_or_lock(locks, keys, schematic)
+    locks, keys = [], []
+    for schematic in schematics:
+        if schematic[0][0] == '#':
+            locks.append(get_pin_height(schematic))
+        else:
+            keys.append(get_pin_height(schematic))
     return keys, locks
 
 
@@ -60,8 +52,23 @@ def matches(locks: Locks, keys: Keys) -> int:
     return total
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    keys, locks = create_keys_and_locks(extract_data_to_list(25))
+def parse(data: str) -> Schematics:
+    """Returns the pin heights of the keys and locks in the data"""
+    return create_keys_and_locks(group_blocks(data.splitlines()))
+
+
+def part_1(schematics: Schematics) -> int:
+    """Returns the number of lock and key pairs that fit together"""
+    keys, locks = schematics
+    return matches(locks, keys)
+
+
+def part_2(schematics: Schematics) -> None:
+    """Day 25 has no second puzzle"""
+    return None
+
 
-    return matches(locks, keys), None
+def solution() -> tuple[int, None]:
+    """Returns a solution as a tuple of an int and None"""
+    schematics = create_keys_and_locks(iter_blocks(25))
+    return part_1(schematics), part_2(schematics)
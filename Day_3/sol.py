@@ -1,5 +1,7 @@
 import re
-from utils.utils import get_raw_input_stream
+from typing import Callable, Iterable, Iterator
+
+from utils.utils import iter_lines
 
 
 def get_all_muls(txt: str) -> list[str]:
@@ -22,12 +24,11 @@ def get_all_ops(txt: str) -> list[str]:
     return re.findall(rgx, txt)
 
 
-def filter_operations(data: list[str]) -> list[str]:
+def filter_operations(data: Iterable[str]) -> Iterator[str]:
     """
-    Removes the do() and don't() commands from the list along with any
-    mul() operation following a don't() command.
+    Removes the do() and don't() commands from the operations along with
+    any mul() operation following a don't() command.
     """
-    valid_operations = []
     add_operations = True
     for op in data:
         if op == "do()":
@@ -35,8 +36,7 @@ def filter_operations(data: list[str]) -> list[str]:
         elif op == "don't()":
             add_operations = False
         elif add_operations:
-            valid_operations.append(op)
-    return valid_operations
+            yield op
 
 
 def get_nums(txt: str) -> tuple[int, int]:
@@ -46,15 +46,13 @@ def get_nums(txt: str) -> tuple[int, int]:
     return int(num_1), int(num_2)
 
 
-def generate_nums_list(data: list[str]) -> list[tuple[int, int]]:
-    """Returns the pairs of numbers found in the list of strings"""
-    nums = []
+def generate_nums_list(data: Iterable[str]) -> Iterator[tuple[int, int]]:
+    """Yields the pairs of numbers found in the strings"""
     for operation in data:
-        nums.append(get_nums(operation))
-    return nums
+        yield get_nums(operation)
 
 
-def sum_product(data: list[tuple[int, int]]) -> int:
+def sum_product(data: Iterable[tuple[int, int]]) -> int:
     """Returns the sum product of the given input"""
     sum_product = 0
     for num_1, num_2 in data:
@@ -62,19 +60,34 @@ def sum_product(data: list[tuple[int, int]]) -> int:
     return sum_product
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    raw_data = get_raw_input_stream(3)
+def scan(
+    lines: Iterable[str], find: Callable[[str], list[str]]
+) -> Iterator[str]:
+    """
+    Yields the matches of find on each line of the memory. The memory is
+    scanned one line at a time, which is equivalent to scanning it whole
+    since none of the operations can span a line break.
+    """
+    for line in lines:
+        yield from find(line)
+
 
-    # Find all valid mul operations
-    matches = get_all_muls(raw_data)
-    data = generate_nums_list(matches)
-    sol_1 = sum_product(data)
+def parse(data: str) -> list[str]:
+    """Returns the lines of the corrupted memory"""
+    return data.splitlines()
 
-    # Find all valid mul operations considering do() and don't()
-    matches = get_all_ops(raw_data)
-    matches = filter_operations(matches)
-    data = generate_nums_list(matches)
-    sol_2 = sum_product(data)
 
-    return sol_1, sol_2
+def part_1(lines: Iterable[str]) -> int:
+    """Returns the sum of all valid mul operations"""
+    return sum_product(generate_nums_list(scan(lines, get_all_muls)))
+
+
+def part_2(lines: Iterable[str]) -> int:
+    """Returns the sum of the mul operations enabled by do() and don't()"""
+    matches = filter_operations(scan(lines, get_all_ops))
+    return sum_product(generate_nums_list(matches))
+
+
+def solution() -> tuple[int, int]:
+    """Returns a solution as a tuple of ints"""
+    return part_1(iter_lines(3)), part_2(iter_lines(3))
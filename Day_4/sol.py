@@ -1,62 +1,61 @@
-from utils.utils import extract_data_to_list
+from utils.utils import Grid, get_raw_input_stream, split_lines
 
 
-def add_padding(data: list[str]) -> list[str]:
-    """Adds padding to the data"""
-    top = [('-' * (len(data)+6-1)) for _ in range(3)]
-    new_list = top[:]
-    for string in data:
-        side = '-' * 3
-        new_list.append(side + string + side)
-    new_list.extend(top[:])
-    return new_list
-
-
-def find_mas(data: list[str], row: int, col: int) -> int:
+def find_mas(grid: Grid, idx: int) -> int:
     """
     Return the number of times the characters 'mas' are found
-    from row, col in data
+    in a straight line from idx in the grid
     """
+    cells = grid.cells
     total = 0
-    for i in [-1, 0, 1]:
-        for j in [-1, 0, 1]:
-            mas_found = True
-            for letter, delta in zip("MAS", [1, 2, 3]):
-                if data[row+(delta*i)][col+(delta*j)] != letter:
-                    mas_found = False
-                    break
-            total += 1 if mas_found else 0
+    for move in grid.diagonal_moves:
+        if (
+            cells[idx + move] == ord('M')
+            and cells[idx + 2*move] == ord('A')
+            and cells[idx + 3*move] == ord('S')
+        ):
+            total += 1
     return total
 
 
-def find_cross_mas(data: list[str], row: int, col: int) -> int:
-    """Return true if a crossed mas is found from the given row and col"""
+def find_cross_mas(grid: Grid, idx: int) -> bool:
+    """Return true if a crossed mas is found around the given idx"""
+    stride = grid.stride
     corners = (
-        data[row-1][col-1] +
-        data[row-1][col+1] +
-        data[row+1][col-1] +
-        data[row+1][col+1]
+        grid[idx - stride - 1] +
+        grid[idx - stride + 1] +
+        grid[idx + stride - 1] +
+        grid[idx + stride + 1]
     )
     valid_seqs = ["MSMS", "SMSM", "SSMM", "MMSS"]
     return corners in valid_seqs
 
 
-def find_all_xmas(data: list[str]) -> tuple[int, int]:
-    """Return the number of times the word xmas is found in given data"""
+def parse(data: str) -> Grid:
+    """
+    Returns the word search as a grid padded wide enough for 'XMAS' to be
+    looked for in every direction without bounds checks
+    """
+    return Grid(split_lines(data), padding=3)
+
+
+def part_1(grid: Grid) -> int:
+    """Return the number of times the word xmas is found in given grid"""
     total_xmas = 0
+    for idx in grid.find_all('X'):
+        total_xmas += find_mas(grid, idx)
+    return total_xmas
+
+
+def part_2(grid: Grid) -> int:
+    """Return the number of times a crossed mas is found in given grid"""
     total_cross_mas = 0
-    for row in range(len(data)):
-        for col in range(len(data[row])):
-            if data[row][col] == 'X':
-                total_xmas += find_mas(data, row, col)
-            if data[row][col] == 'A':
-                total_cross_mas += 1 if find_cross_mas(data, row, col) else 0
-    return total_xmas, total_cross_mas
+    for idx in grid.find_all('A'):
+        total_cross_mas += 1 if find_cross_mas(grid, idx) else 0
+    return total_cross_mas
 
 
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    data = add_padding(extract_data_to_list(4))
-    sol_1, sol_2 = find_all_xmas(data)
-
-    return sol_1, sol_2
+    grid = parse(get_raw_input_stream(4))
+    return part_1(grid), part_2(grid)
@@ -1,4 +1,9 @@
-from utils.utils import extract_data_to_list
+from utils.utils import get_raw_input_stream, split_lines
+
+Rules = dict[str, list[str]]
+# The page ordering rules along with the updates already in the right order
+# and the ones that are not
+Manuals = tuple[Rules, list[list[str]], list[list[str]]]
 
 
 def get_rules(data: list[str]) -> dict[str, list[str]]:
@@ -82,13 +87,27 @@ def get_fixed_midpoints_sum(
     return total_sum
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    data = extract_data_to_list(5)
-    rules, data = get_rules(data), get_update_pages(data)
-    valid, invalid = separate_sequences(data, rules)
+def parse(data: str) -> Manuals:
+    """Returns the rules and the updates separated by whether they are valid"""
+    lines = split_lines(data)
+    rules, updates = get_rules(lines), get_update_pages(lines)
+    valid, invalid = separate_sequences(updates, rules)
+    return rules, valid, invalid
+
+
+def part_1(manuals: Manuals) -> int:
+    """Returns the sum of the middle pages of the valid updates"""
+    _, valid, _ = manuals
+    return get_middle_page_sum(valid)
 
-    sol_1 = get_middle_page_sum(valid)
-    sol_2 = get_fixed_midpoints_sum(invalid, rules)
 
-    return sol_1, sol_2
+def part_2(manuals: Manuals) -> int:
+    """Returns the sum of the middle pages of the fixed invalid updates"""
+    rules, _, invalid = manuals
+    return get_fixed_midpoints_sum(invalid, rules)
+
+
+def solution() -> tuple[int, int]:
+    """Returns a solution as a tuple of ints"""
+    manuals = parse(get_raw_input_stream(5))
+    return part_1(manuals), part_2(manuals)
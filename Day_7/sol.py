@@ -1,6 +1,10 @@
-from utils.utils import extract_data_to_list
+from utils.profiling import profiled
+from utils.utils import get_raw_input_stream, split_lines
 
+Equations = list[tuple[int, list[int]]]
 
+
+@profiled
 def create_operation_permutations(
     target_len: int, *,
     unique_combos: set[tuple[str, ...]] | None = None,
@@ -52,6 +56,7 @@ def perform_operations(nums: list[int], operations: tuple[str, ...]) -> int:
     return total
 
 
+@profiled
 def has_solution(target: int, nums: list[int], concat: bool = False) -> bool:
     """
     Returns True if there is a combination of '+' and '*' that
@@ -100,10 +105,22 @@ def convert_data(data: list[str]) -> list[tuple[int, list[int]]]:
     return new_data
 
 
+def parse(data: str) -> Equations:
+    """Returns the target and the numbers of each equation in the data"""
+    return convert_data(split_lines(data))
+
+
+def part_1(equations: Equations) -> int:
+    """Returns the calibration result using + and *"""
+    return find_valid_sums(equations)
+
+
+def part_2(equations: Equations) -> int:
+    """Returns the calibration result using +, * and ||"""
+    return find_valid_sums_2(equations)
+
+
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    data = extract_data_to_list(7)
-    data = convert_data(data)
-    sol_1 = find_valid_sums(data)
-    sol_2 = find_valid_sums_2(data)
-    return sol_1, sol_2
+    equations = parse(get_raw_input_stream(7))
+    return part_1(equations), part_2(equations)
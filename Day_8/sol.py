@@ -1,9 +1,12 @@
-from utils.utils import extract_data_to_list_of_list
+from utils.trace import TRACING, dump_frame
+from utils.utils import Grid, get_raw_input_stream, split_lines
 
+# Antinodes can lie any distance off the grid, so they are found with row,
+# col points rather than flat indices (which would wrap into other rows)
 Point = tuple[int, int]
 Points = list[Point]
-Grid = list[list[str]]
 AntennaMap = dict[str, list[Point]]
+City = tuple[Grid, AntennaMap]
 
 
 def calculate_distance(point_1: Point, point_2: Point) -> Point:
@@ -31,13 +34,6 @@ def subtract_slope(point: Point, slope: Point) -> Point:
     return get_possible_antinode(point, slope, -1)
 
 
-def is_on_grid(grid: Grid, point: set[Point]) -> None:
-    """Returns true if point is on the grid"""
-    row_max, col_max = len(grid), len(grid[0])
-    row, col = point
-    return 0 <= row < row_max and 0 <= col < col_max
-
-
 def find_antenna_antinodes(
     center: Point, points: Points, grid: Grid,
     antinodes: set[Point], harmonic_antinodes: set[Point]
@@ -47,18 +43,18 @@ def find_antenna_antinodes(
         if center != point:
             slope = calculate_distance(center, point)
             left_side = subtract_slope(center, slope)
-            if is_on_grid(grid, left_side):
+            if grid.contains(*left_side):
                 antinodes.add(left_side)
             harmonic_antinodes.add(center)
-            while is_on_grid(grid, left_side):
+            while grid.contains(*left_side):
                 harmonic_antinodes.add(left_side)
                 left_side = subtract_slope(left_side, slope)
 
             right_side = add_slope(point, slope)
-            if is_on_grid(grid, right_side):
+            if grid.contains(*right_side):
                 antinodes.add(right_side)
             harmonic_antinodes.add(point)
-            while is_on_grid(grid, right_side):
+            while grid.contains(*right_side):
                 harmonic_antinodes.add(right_side)
                 right_side = add_slope(right_side, slope)
 
@@ -72,8 +68,11 @@ def find_all_antinodes(grid: Grid, antenna_map: AntennaMap) -> int:
             find_antenna_antinodes(
                 point, locations, grid, antinodes, harmonic_antinodes
             )
-    for row, col in harmonic_antinodes:
-        grid[row][col] = '#'
+    if TRACING:
+        frame = grid.copy()
+        for point in harmonic_antinodes:
+            frame[frame.index(*point)] = '#'
+        dump_frame("Day 8 antinodes", str(frame))
 
     return len(antinodes), len(harmonic_antinodes)
 
@@ -84,25 +83,30 @@ def get_antenna_map(grid: Grid) -> AntennaMap:
     their locations stored in a list as tuples
     """
     antenna_map = {}
-    for row, chars in enumerate(grid):
-        for col, char in enumerate(chars):
-            if char != '.':
-                antenna_map.setdefault(char, []).append((row, col))
+    empty = ord('.')
+    for idx, cell in enumerate(grid.cells):
+        if cell != empty and grid.in_grid(idx):
+            antenna_map.setdefault(chr(cell), []).append(grid.point(idx))
     return antenna_map
 
 
-def print_grid(grid):
-    for row in grid:
-        for char in row:
-            print(f'{char}', end="")
-        print()
+def parse(data: str) -> City:
+    """Returns the map of the city along with the antennas found on it"""
+    grid = Grid(split_lines(data))
+    return grid, get_antenna_map(grid)
+
+
+def part_1(city: City) -> int:
+    """Returns the number of antinodes on the map"""
+    return find_all_antinodes(*city)[0]
+
+
+def part_2(city: City) -> int:
+    """Returns the number of antinodes on the map including harmonics"""
+    return find_all_antinodes(*city)[1]
 
 
 def solution() -> tuple[int, int]:
     """Returns a solution as a tuple of ints"""
-    grid: Grid = extract_data_to_list_of_list(8)
-    antenna_map: AntennaMap = get_antenna_map(grid)
-    sol_1, sol_2 = find_all_antinodes(grid, antenna_map)
-    print_grid(grid)
-
-    return sol_1, sol_2
+    city = parse(get_raw_input_stream(8))
+    return find_all_antinodes(*city)
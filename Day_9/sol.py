@@ -96,15 +96,26 @@ def calculate_check_sum(disk: Disk) -> int:
     return sum([idx * val for idx, val in enumerate(disk) if val != '.'])
 
 
-def solution() -> tuple[int, int]:
-    """Returns a solution as a tuple of ints"""
-    data = convert_to_numbers(get_raw_input_stream(9))
-    disk = convert_to_disk_format(data)
+def parse(data: str) -> Disk:
+    """Returns the disk described by the disk map in the data"""
+    return convert_to_disk_format(convert_to_numbers(data.strip()))
+
+
+def part_1(disk: Disk) -> int:
+    """Returns the checksum after moving blocks one at a time"""
+    disk = disk.copy()
     compress_disk(disk)
-    sol_1 = calculate_check_sum(disk)
+    return calculate_check_sum(disk)
 
-    disk = convert_to_disk_format(data)
+
+def part_2(disk: Disk) -> int:
+    """Returns the checksum after moving whole files"""
+    disk = disk.copy()
     compress_disk_2(disk)
-    sol_2 = calculate_check_sum(disk)
+    return calculate_check_sum(disk)
+
 
-    return sol_1, sol_2
+def solution() -> tuple[int, int]:
+    """Returns a solution as a tuple of ints"""
+    disk = parse(get_raw_input_stream(9))
+    return part_1(disk), part_2(disk)
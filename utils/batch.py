@@ -0,0 +1,158 @@
+import argparse
+import contextlib
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
+from typing import Iterator
+
+from utils.runner import (
+    DAYS, PARTS, call_with_timeout, silenced, solve_data
+)
+
+FileResult = dict[str, object]
+
+
+def solve_file(day: int, fp: str, part: int | None = None) -> FileResult:
+    """
+    Solves the day for the input found at fp and returns the result along
+    with the wall time spent. Errors are reported in the result instead of
+    being raised so one bad input does not stop a batch.
+    """
+    start = time.perf_counter()
+    try:
+        with open(fp, "r") as file_obj:
+            data = file_obj.read()
+        with silenced():
+            result = solve_data(day, data, part)
+        file_result = {'input': fp, 'result': result}
+    except Exception as error:
+        file_result = {
+            'input': fp, 'error': f"{type(error).__name__}: {error}"
+        }
+    file_result['wall'] = time.perf_counter() - start
+    return file_result
+
+
+def solve_file_with_timeout(
+    day: int, fp: str, part: int | None, timeout: float
+) -> FileResult:
+    """
+    Solves the input at fp like solve_file in a worker process of its own,
+    which is killed after timeout seconds. A timeout or a worker that died
+    (i.e., killed for running out of memory) is reported as an error.
+    """
+    start = time.perf_counter()
+    try:
+        return call_with_timeout(solve_file, (day, fp, part), timeout)
+    except Exception as error:
+        return {
+            'input': fp, 'error': f"{type(error).__name__}: {error}",
+            'wall': time.perf_counter() - start
+        }
+
+
+def find_inputs(directory: str, pattern: str = "*.txt") -> list[str]:
+    """Returns the sorted paths of the files in directory matching pattern"""
+    return sorted(
+        fp for fp in glob.glob(os.path.join(directory, pattern))
+        if os.path.isfile(fp)
+    )
+
+
+def solve_batch(
+    day: int, fps: list[str], part: int | None = None,
+    jobs: int | None = None, timeout: float | None = None
+) -> Iterator[FileResult]:
+    """
+    Solves the day for every input in a process pool and yields each result
+    as soon as it finishes (not in the order of fps). With a timeout every
+    input gets a worker process of its own (at most jobs at a time) instead.
+    """
+    start = time.perf_counter()
+    if timeout is None:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        args = [(solve_file, day, fp, part) for fp in fps]
+    else:
+        # The threads only wait on the workers
+        executor = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+        args = [
+            (solve_file_with_timeout, day, fp, part, timeout) for fp in fps
+        ]
+    with executor:
+        futures = {
+            executor.submit(*task_args): fp for task_args, fp in zip(args, fps)
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as error:
+                # i.e., the pool broke because a worker was killed
+                yield {
+                    'input': futures[future],
+                    'error': f"{type(error).__name__}: {error}",
+                    'wall': time.perf_counter() - start
+                }
+
+
+def format_file_result(file_result: FileResult) -> str:
+    """Returns a one line summary of the result for one input"""
+    outcome = file_result.get('result', file_result.get('error'))
+    return (
+        f"{file_result['wall']:>9.3f}s  {file_result['input']}  {outcome}"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solves one day for every input file in a directory"
+    )
+    parser.add_argument("day", type=int, choices=DAYS)
+    parser.add_argument("directory", help="directory holding the inputs")
+    parser.add_argument(
+        "--pattern", default="*.txt", help="glob the input files must match"
+    )
+    parser.add_argument(
+        "--part", type=int, choices=PARTS,
+        help="only solve one part for each input"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="number of worker processes (defaults to the number of cores)"
+    )
+    parser.add_argument(
+        "--output", help="path of a json lines file to append results to"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None,
+        help="seconds an input may take before its worker is killed"
+    )
+    args = parser.parse_args(argv)
+
+    fps = find_inputs(args.directory, args.pattern)
+    failures = 0
+    start = time.perf_counter()
+    with (
+        open(args.output, "a") if args.output else contextlib.nullcontext()
+    ) as output:
+        for file_result in solve_batch(
+            args.day, fps, args.part, args.jobs, args.timeout
+        ):
+            print(format_file_result(file_result), flush=True)
+            failures += 'error' in file_result
+            if output:
+                output.write(json.dumps(file_result) + "\n")
+                output.flush()
+    print(
+        f"Solved {len(fps) - failures}/{len(fps)} inputs in "
+        f"{time.perf_counter() - start:.3f}s"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
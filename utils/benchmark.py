@@ -0,0 +1,195 @@
+import argparse
+import datetime
+import importlib
+import json
+import math
+import platform
+import statistics
+import time
+from types import ModuleType
+from typing import Callable
+
+from utils.runner import DAYS, parse_days, silenced
+from utils.utils import extract_to_grid, get_raw_input_stream
+
+Setup = Callable[[], tuple[Callable, tuple]]
+Stats = dict[str, str | int | float]
+
+
+def get_module(day: int) -> ModuleType:
+    """Returns the Day_{day}.sol module"""
+    return importlib.import_module(f"Day_{day}.sol")
+
+
+def setup_solution(day: int) -> Setup:
+    """Returns a setup function that benchmarks the solution of the day"""
+    return lambda: (get_module(day).solution, ())
+
+
+def setup_day_1_vectorized() -> tuple[Callable, tuple]:
+    """Returns Day_1.sol.solution and the arguments of its NumPy path"""
+    return get_module(1).solution, (True,)
+
+
+def setup_day_2_vectorized() -> tuple[Callable, tuple]:
+    """Returns Day_2.sol.solution and the arguments of its NumPy path"""
+    return get_module(2).solution, (True,)
+
+
+def setup_day_6_loops() -> tuple[Callable, tuple]:
+    """Returns Day_6.sol.num_infinite_loops and its arguments"""
+    sol = get_module(6)
+    grid = extract_to_grid(6)
+    return sol.num_infinite_loops, (grid, sol.find_start(grid))
+
+
+def setup_day_12_regions() -> tuple[Callable, tuple]:
+    """Returns Day_12.sol.find_regions and its arguments"""
+    return get_module(12).find_regions, (extract_to_grid(12),)
+
+
+def setup_day_14_easter_egg() -> tuple[Callable, tuple]:
+    """Returns Day_14.sol.find_easter_egg and its arguments"""
+    sol = get_module(14)
+    robots = sol.parse(get_raw_input_stream(14))
+    return sol.find_easter_egg, (robots,)
+
+
+def setup_day_18_blocking_byte() -> tuple[Callable, tuple]:
+    """Returns Day_18.sol.find_blocking_byte and its arguments"""
+    return get_module(18).find_blocking_byte, ()
+
+
+# Inner functions worth tracking on their own, keyed by day
+INNER_BENCHMARKS: dict[int, dict[str, Setup]] = {
+    1: {'solution_vectorized': setup_day_1_vectorized},
+    2: {'solution_vectorized': setup_day_2_vectorized},
+    6: {'num_infinite_loops': setup_day_6_loops},
+    12: {'find_regions': setup_day_12_regions},
+    14: {'find_easter_egg': setup_day_14_easter_egg},
+    18: {'find_blocking_byte': setup_day_18_blocking_byte},
+}
+
+
+def collect_benchmarks(
+    days: list[int], include_inner: bool = True
+) -> dict[str, Setup]:
+    """Returns the benchmarks for the given days keyed by name"""
+    benchmarks = {}
+    for day in days:
+        benchmarks[f"Day_{day}.solution"] = setup_solution(day)
+        if include_inner:
+            for name, setup in INNER_BENCHMARKS.get(day, {}).items():
+                benchmarks[f"Day_{day}.{name}"] = setup
+    return benchmarks
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Returns the nearest-rank percentile of the samples"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def time_benchmark(setup: Setup, warmup: int, repeat: int) -> list[float]:
+    """
+    Returns the wall time of each repeated run. Setup is called before every
+    run (outside of the timed section) so functions that mutate their input
+    always start from the same state.
+    """
+    samples = []
+    for run in range(warmup + repeat):
+        func, args = setup()
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if run >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def summarize(name: str, samples: list[float]) -> Stats:
+    """Returns the timing statistics of the samples"""
+    return {
+        'name': name,
+        'runs': len(samples),
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'mean': statistics.fmean(samples),
+        'p95': percentile(samples, 95),
+        'max': max(samples),
+        'samples': samples,
+    }
+
+
+def format_stats(stats: Stats) -> str:
+    """Returns a one line summary of the statistics"""
+    return (
+        f"{stats['name']:<28} "
+        f"min {stats['min']:>9.4f}s  "
+        f"median {stats['median']:>9.4f}s  "
+        f"p95 {stats['p95']:>9.4f}s"
+    )
+
+
+def run_benchmarks(
+    benchmarks: dict[str, Setup], warmup: int = 1, repeat: int = 5,
+    quiet: bool = True
+) -> list[Stats]:
+    """Runs each benchmark sequentially and prints its statistics"""
+    results = []
+    for name, setup in benchmarks.items():
+        with silenced(quiet):
+            samples = time_benchmark(setup, warmup, repeat)
+        stats = summarize(name, samples)
+        print(format_stats(stats), flush=True)
+        results.append(stats)
+    return results
+
+
+def write_report(fp: str, results: list[Stats], warmup: int) -> None:
+    """Writes the benchmark results along with run metadata to fp as json"""
+    report = {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'warmup': warmup,
+        'results': results,
+    }
+    with open(fp, "w") as file_obj:
+        json.dump(report, file_obj, indent=2)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the Advent of Code solutions"
+    )
+    parser.add_argument(
+        "--days", default=f"{DAYS[0]}-{DAYS[-1]}",
+        help="days to benchmark (i.e., '1-25' or '6,12')"
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--solutions-only", action="store_true",
+        help="skip the inner function benchmarks"
+    )
+    parser.add_argument("--output", help="path of the json report")
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="show output printed by the solutions"
+    )
+    args = parser.parse_args(argv)
+
+    benchmarks = collect_benchmarks(
+        parse_days(args.days), not args.solutions_only
+    )
+    results = run_benchmarks(
+        benchmarks, args.warmup, args.repeat, not args.verbose
+    )
+    if args.output:
+        write_report(args.output, results, args.warmup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import contextlib
+import importlib
+import os
+import sys
+from types import ModuleType
+from typing import Callable, TypeVar
+
+from utils.utils import PARENT_DIR, build_fp, get_raw_input_stream
+
+T = TypeVar("T")
+
+CACHE_DIR = os.environ.get(
+    "AOC_CACHE_DIR", os.path.join(PARENT_DIR, ".cache")
+)
+UTILS_DIR = os.path.join(PARENT_DIR, "utils")
+UTILS_FP = os.path.join(UTILS_DIR, "utils.py")
+
+
+def cache_enabled() -> bool:
+    """Returns false if caching was turned off with AOC_CACHE=0"""
+    return os.environ.get("AOC_CACHE", "1") != "0"
+
+
+def hash_files(*fps: str) -> str:
+    """Returns the sha256 hex digest of the contents of the files"""
+    import hashlib
+
+    digest = hashlib.sha256()
+    for fp in fps:
+        with open(fp, "rb") as file_obj:
+            digest.update(hashlib.file_digest(file_obj, "sha256").digest())
+    return digest.hexdigest()
+
+
+def read_pickle(fp: str) -> object:
+    """Returns the object pickled in fp"""
+    import pickle
+
+    with open(fp, "rb") as file_obj:
+        return pickle.load(file_obj)
+
+
+def write_pickle(fp: str, obj: object) -> None:
+    """
+    Pickles obj to fp. The file is written next to fp first and then moved
+    into place so readers never see a partially written file. The temporary
+    name starts with a dot so remove_stale never matches it.
+    """
+    import pickle
+
+    directory, name = os.path.split(fp)
+    os.makedirs(directory, exist_ok=True)
+    tmp_fp = os.path.join(directory, f".{name}.{os.getpid()}.tmp")
+    with open(tmp_fp, "wb") as file_obj:
+        pickle.dump(obj, file_obj, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_fp, fp)
+
+
+def remove_stale(directory: str, prefix: str, keep: str) -> None:
+    """Removes the files in directory starting with prefix other than keep"""
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name != os.path.basename(keep):
+            # A concurrent run may have removed it already
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(directory, name))
+
+
+def load_parsed(day: int, parse: Callable[[str], T]) -> T:
+    """
+    Returns parse applied to the day's raw input. The parsed structure is
+    pickled under .cache/parsed keyed by a hash of the input file and of the
+    module defining parse (and utils), so later runs load it instead of
+    parsing again until one of them changes. Every call returns a fresh
+    copy, so callers are free to mutate the result.
+    """
+    if not cache_enabled():
+        return parse(get_raw_input_stream(day))
+
+    module_fp = sys.modules[parse.__module__].__file__
+    key = hash_files(build_fp(day), module_fp, UTILS_FP)
+    directory = os.path.join(CACHE_DIR, "parsed")
+    prefix = f"Day_{day}-{parse.__qualname__}-"
+    fp = os.path.join(directory, f"{prefix}{key[:16]}.pickle")
+
+    if os.path.exists(fp):
+        return read_pickle(fp)
+    parsed = parse(get_raw_input_stream(day))
+    write_pickle(fp, parsed)
+    remove_stale(directory, prefix, fp)
+    return parsed
+
+
+def source_files(module: ModuleType) -> list[str]:
+    """
+    Returns the file of module along with utils/utils.py and the files of
+    any other utils modules it imports from
+    """
+    files = {UTILS_FP}
+    for value in vars(module).values():
+        if isinstance(value, ModuleType):
+            name = value.__name__
+        else:
+            name = getattr(value, "__module__", None)
+        fp = getattr(sys.modules.get(name), "__file__", None)
+        if fp is not None and os.path.dirname(fp) == UTILS_DIR:
+            files.add(fp)
+    return [module.__file__, *sorted(files)]
+
+
+def load_result(
+    day: int, solution: Callable[[], T], name: str = "solution"
+) -> tuple[T, bool]:
+    """
+    Returns the result of the day's solution and whether it was read from
+    .cache/results instead of being computed. A stored result is only used
+    while the input, the day's sol.py and the utils modules it uses are
+    unchanged since it was computed. Results of different functions of the
+    same day (i.e., part_1) are stored separately under their name.
+    """
+    if not cache_enabled():
+        return solution(), False
+
+    module = importlib.import_module(f"Day_{day}.sol")
+    key = hash_files(build_fp(day), *source_files(module))
+    suffix = "" if name == "solution" else f"-{name}"
+    fp = os.path.join(CACHE_DIR, "results", f"Day_{day}{suffix}.pickle")
+
+    if os.path.exists(fp):
+        stored_key, result = read_pickle(fp)
+        if stored_key == key:
+            return result, True
+    result = solution()
+    write_pickle(fp, (key, result))
+    return result, False
@@ -0,0 +1,48 @@
+import json
+import os
+import socket
+import sys
+
+# Kept free of imports from the rest of the repo so the client starts fast
+SOCKET_PATH = os.environ.get(
+    "AOC_SOCKET",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), ".cache",
+                 "aoc.sock")
+)
+
+
+def send(request: str, socket_path: str = SOCKET_PATH) -> dict:
+    """Sends one request line to the server and returns its json response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(request.encode() + b"\n")
+        with sock.makefile("rb") as file_obj:
+            return json.loads(file_obj.readline())
+
+
+def main(argv: list[str] | None = None) -> int:
+    import shlex
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print(
+            "usage: python -m utils.client solve day=N [part=1|2] "
+            "[input=PATH] | ping | stop", file=sys.stderr
+        )
+        return 2
+    # The server does not share our working directory
+    argv = [
+        f"input={os.path.abspath(arg[6:])}" if arg.startswith("input=")
+        else arg for arg in argv
+    ]
+    # Quoted so the server splits paths containing spaces correctly
+    response = send(shlex.join(argv))
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        return 1
+    print(response["result"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+import functools
+from collections import OrderedDict
+from typing import Callable, Hashable, NamedTuple, TypeVar
+
+F = TypeVar("F", bound=Callable)
+KeyFunc = Callable[..., Hashable]
+
+
+class CacheInfo(NamedTuple):
+    """The hits, misses, bound (None if unbounded) and size of a cache"""
+    hits: int
+    misses: int
+    maxsize: int | None
+    size: int
+
+
+# Every memoized function keyed by its qualified name so their statistics
+# can be reported together
+MEMOIZED: dict[str, Callable] = {}
+
+
+def memoize(
+    maxsize: int | None = None, key: KeyFunc | None = None
+) -> Callable[[F], F]:
+    """
+    Caches the results of the decorated function. When maxsize is given the
+    least recently used result is evicted once the cache is full. key builds
+    the cache key from the arguments, which allows arguments that stay the
+    same during a solve (and may not be hashable) to be left out and keys to
+    be packed into something cheaper to hash than a tuple (i.e., one int).
+    Without it a single argument is its own key and several arguments are
+    stored as a tuple. The decorated function gains cache_info() and
+    cache_clear().
+    """
+    def decorator(func: F) -> F:
+        cache = {} if maxsize is None else OrderedDict()
+        hits = misses = 0
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            nonlocal hits, misses
+            if key is not None:
+                cache_key = key(*args)
+            else:
+                cache_key = args[0] if len(args) == 1 else args
+            try:
+                result = cache[cache_key]
+            except KeyError:
+                pass
+            else:
+                hits += 1
+                if maxsize is not None:
+                    cache.move_to_end(cache_key)
+                return result
+
+            misses += 1
+            result = func(*args)
+            cache[cache_key] = result
+            if maxsize is not None and len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        def cache_info() -> CacheInfo:
+            return CacheInfo(hits, misses, maxsize, len(cache))
+
+        def cache_clear() -> None:
+            nonlocal hits, misses
+            cache.clear()
+            hits = misses = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        MEMOIZED[f"{func.__module__}.{func.__qualname__}"] = wrapper
+        return wrapper
+    return decorator
+
+
+def format_cache_info(name: str, info: CacheInfo) -> str:
+    """Returns a one line summary of a cache's statistics"""
+    lookups = info.hits + info.misses
+    hit_rate = info.hits / lookups if lookups else 0.0
+    bound = "unbounded" if info.maxsize is None else f"max {info.maxsize}"
+    return (
+        f"{info.hits:>10} hits  {info.misses:>10} misses  "
+        f"{hit_rate:>7.1%}  size {info.size:>9} ({bound})  {name}"
+    )
+
+
+def cache_report(prefix: str = "") -> str:
+    """
+    Returns the statistics of every memoized function whose qualified name
+    starts with prefix (i.e., 'Day_19.')
+    """
+    return "\n".join([
+        format_cache_info(name, func.cache_info())
+        for name, func in MEMOIZED.items() if name.startswith(prefix)
+    ])
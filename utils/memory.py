@@ -0,0 +1,113 @@
+import argparse
+import json
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.runner import DAYS, load_solution, parse_days, silenced
+
+Site = dict[str, str | int]
+MemoryReport = dict[str, int | tuple | list[Site]]
+
+MB = 1024 * 1024
+
+
+def get_sites(snapshot: tracemalloc.Snapshot, top: int) -> list[Site]:
+    """Returns the lines holding the most memory in the snapshot"""
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ])
+    sites = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        sites.append({
+            'site': f"{frame.filename}:{frame.lineno}",
+            'size': stat.size,
+            'blocks': stat.count,
+        })
+    return sites
+
+
+def trace_day(day: int, top: int = 5, frames: int = 1) -> MemoryReport:
+    """
+    Runs the day's solution under tracemalloc and returns the peak size of
+    the Python heap during the run, the size and number of the blocks still
+    allocated when it returns, and the lines that allocated the most of them.
+    Meant to be run in a fresh worker process so memory held by other days
+    (or by imports) is not counted.
+    """
+    solution = load_solution(day)
+    tracemalloc.start(frames)
+    try:
+        with silenced():
+            result = solution()
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return {
+        'day': day,
+        'result': result,
+        'peak': peak,
+        'retained': current,
+        'blocks': len(snapshot.traces),
+        'sites': get_sites(snapshot, top),
+    }
+
+
+def format_report(report: MemoryReport) -> str:
+    """Returns a summary of the day's memory usage and top allocation sites"""
+    lines = [
+        f"Day {report['day']:>2}  "
+        f"peak {report['peak'] / MB:>9.2f}MB  "
+        f"retained {report['retained'] / MB:>9.2f}MB  "
+        f"blocks {report['blocks']:>9}"
+    ]
+    for site in report['sites']:
+        lines.append(
+            f"        {site['size'] / MB:>9.2f}MB  "
+            f"{site['blocks']:>9} blocks  {site['site']}"
+        )
+    return "\n".join(lines)
+
+
+def trace_days(days: list[int], top: int = 5) -> list[MemoryReport]:
+    """
+    Traces each day sequentially, each in its own worker process, and prints
+    its report as it finishes
+    """
+    reports = []
+    for day in days:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            report = executor.submit(trace_day, day, top).result()
+        print(format_report(report), flush=True)
+        reports.append(report)
+    return reports
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Reports the peak Python heap usage of each solution"
+    )
+    parser.add_argument(
+        "--days", default=f"{DAYS[0]}-{DAYS[-1]}",
+        help="days to trace (i.e., '1-25' or '9,20,22')"
+    )
+    parser.add_argument(
+        "--top", type=int, default=5,
+        help="number of allocation sites to show per day"
+    )
+    parser.add_argument("--output", help="path of the json report")
+    args = parser.parse_args(argv)
+
+    reports = trace_days(parse_days(args.days), args.top)
+    print("\nDays by peak heap usage")
+    for report in sorted(reports, key=lambda r: r['peak'], reverse=True):
+        print(f"Day {report['day']:>2}  {report['peak'] / MB:>9.2f}MB")
+    if args.output:
+        with open(args.output, "w") as file_obj:
+            json.dump(reports, file_obj, indent=2)
+
+
+if __name__ == "__main__":
+    main()
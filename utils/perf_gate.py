@@ -0,0 +1,121 @@
+import argparse
+import json
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.runner import DAYS, parse_days, run_day
+
+Measurement = dict[str, int | float]
+Baseline = dict[str, Measurement]
+
+
+def measure_day(day: int, repeat: int = 3) -> Measurement:
+    """
+    Returns the fastest wall time of repeated runs of the day's solution
+    and the peak resident memory of the process running it. Meant to be run
+    in a fresh worker process so the memory reading only covers this day.
+    """
+    times = [run_day(day)['wall'] for _ in range(repeat)]
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {'day': day, 'time': min(times), 'peak_kb': peak_kb}
+
+
+def measure(days: list[int], repeat: int = 3) -> Baseline:
+    """
+    Measures each day sequentially, each in its own worker process, and
+    returns the measurements keyed by day
+    """
+    measurements = {}
+    for day in days:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            measurement = executor.submit(measure_day, day, repeat).result()
+        print(
+            f"Day {day:>2}  time {measurement['time']:>9.3f}s  "
+            f"peak {measurement['peak_kb'] / 1024:>8.1f}MB", flush=True
+        )
+        measurements[str(day)] = measurement
+    return measurements
+
+
+def write_baseline(fp: str, measurements: Baseline) -> None:
+    """Writes the measurements to fp as json"""
+    with open(fp, "w") as file_obj:
+        json.dump(measurements, file_obj, indent=2)
+
+
+def read_baseline(fp: str) -> Baseline:
+    """Returns the measurements stored in fp"""
+    with open(fp, "r") as file_obj:
+        return json.load(file_obj)
+
+
+def find_regressions(
+    baseline: Baseline, current: Baseline, threshold: float,
+    memory_threshold: float, min_time: float
+) -> list[str]:
+    """
+    Returns a description of every day that got slower than the baseline by
+    more than threshold (or used more memory by more than memory_threshold).
+    Days faster than min_time in both runs are too noisy to compare.
+    """
+    regressions = []
+    for day, measurement in current.items():
+        if day not in baseline:
+            continue
+        old, new = baseline[day], measurement
+        time_limit = old['time'] * (1 + threshold)
+        if new['time'] > time_limit and new['time'] > min_time:
+            regressions.append(
+                f"Day {day}: time {old['time']:.3f}s -> {new['time']:.3f}s"
+            )
+        memory_limit = old['peak_kb'] * (1 + memory_threshold)
+        if new['peak_kb'] > memory_limit:
+            regressions.append(
+                f"Day {day}: peak memory {old['peak_kb'] / 1024:.1f}MB -> "
+                f"{new['peak_kb'] / 1024:.1f}MB"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Records and checks performance baselines"
+    )
+    parser.add_argument("mode", choices=["record", "compare"])
+    parser.add_argument(
+        "--baseline", default="perf_baseline.json",
+        help="path of the baseline json file"
+    )
+    parser.add_argument("--days", default=f"{DAYS[0]}-{DAYS[-1]}")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="allowed fractional slow down before failing (i.e., 0.2 = 20%%)"
+    )
+    parser.add_argument(
+        "--memory-threshold", type=float, default=0.2,
+        help="allowed fractional increase in peak memory before failing"
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.05,
+        help="days faster than this many seconds are not time checked"
+    )
+    args = parser.parse_args(argv)
+
+    measurements = measure(parse_days(args.days), args.repeat)
+    if args.mode == "record":
+        write_baseline(args.baseline, measurements)
+        return 0
+
+    regressions = find_regressions(
+        read_baseline(args.baseline), measurements, args.threshold,
+        args.memory_threshold, args.min_time
+    )
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import functools
+import os
+import time
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+# The day modules import this module for @profiled, so everything only the
+# profiler needs is imported lazily to keep importing them cheap
+if TYPE_CHECKING:
+    import pstats
+
+F = TypeVar("F", bound=Callable)
+
+# Calls and cumulative seconds of every function wrapped with @profiled
+TIMINGS: dict[str, list[int | float]] = {}
+
+SORT_KEYS = ("cumulative", "tottime", "ncalls")
+
+
+def profiling_enabled() -> bool:
+    """Returns true if the timers were turned on with AOC_PROFILE=1"""
+    return os.environ.get("AOC_PROFILE", "0") == "1"
+
+
+def profiled(func: F) -> F:
+    """
+    Counts the calls of func and the time spent in it when AOC_PROFILE=1 is
+    set before the module defining func is imported. Recursive calls are
+    counted, but only the outermost call is timed so the cumulative time is
+    not counted twice. Otherwise func is returned unchanged, so leaving the
+    decorator on a hot function costs nothing.
+    """
+    if not profiling_enabled():
+        return func
+
+    name = f"{func.__module__}.{func.__qualname__}"
+    timing = TIMINGS.setdefault(name, [0, 0.0])
+    depth = 0
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nonlocal depth
+        timing[0] += 1
+        if depth:
+            return func(*args, **kwargs)
+        depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timing[1] += time.perf_counter() - start
+            depth -= 1
+    return wrapper
+
+
+def format_timings(timings: dict[str, list[int | float]]) -> str:
+    """Returns the recorded timers sorted by cumulative time"""
+    lines = [f"{'calls':>10}  {'cumtime':>9}  function"]
+    ordered = sorted(
+        timings.items(), key=lambda item: item[1][1], reverse=True
+    )
+    for name, (calls, cumulative) in ordered:
+        lines.append(f"{calls:>10}  {cumulative:>8.3f}s  {name}")
+    return "\n".join(lines)
+
+
+def profile_day(
+    day: int, quiet: bool = True
+) -> tuple[tuple, "pstats.Stats"]:
+    """Returns the result of the day's solution and its cProfile stats"""
+    import cProfile
+    import pstats
+
+    from utils.runner import load_solution, silenced
+
+    solution = load_solution(day)
+    profiler = cProfile.Profile()
+    with silenced(quiet):
+        result = profiler.runcall(solution)
+    return result, pstats.Stats(profiler)
+
+
+def format_stats(
+    stats: "pstats.Stats", sort: str = "cumulative", top: int = 20
+) -> str:
+    """Returns the top functions of the stats with their calls and times"""
+    import io
+
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    return stream.getvalue()
+
+
+def main(argv: list[str] | None = None) -> None:
+    import argparse
+    import importlib
+
+    from utils.memo import cache_report
+    from utils.runner import DAYS, load_solution, parse_days, silenced
+
+    parser = argparse.ArgumentParser(
+        description="Profiles the Advent of Code solutions with cProfile"
+    )
+    parser.add_argument(
+        "--days", default=f"{DAYS[0]}-{DAYS[-1]}",
+        help="days to profile (i.e., '1-25' or '7,12')"
+    )
+    parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative")
+    parser.add_argument(
+        "--top", type=int, default=20, help="number of functions to show"
+    )
+    parser.add_argument(
+        "--output", help="directory to dump Day_N.prof files into"
+    )
+    parser.add_argument(
+        "--timers", action="store_true",
+        help="only report the functions decorated with @profiled"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="show output printed by the solutions"
+    )
+    args = parser.parse_args(argv)
+    if args.timers and args.output:
+        parser.error("--output needs cProfile stats, which --timers skips")
+
+    if args.timers:
+        # Must be set before the day modules are imported
+        os.environ["AOC_PROFILE"] = "1"
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+
+    # When run with -m this module is __main__, while the days record their
+    # timers in the imported utils.profiling
+    timings = importlib.import_module("utils.profiling").TIMINGS
+    for day in parse_days(args.days):
+        if args.timers:
+            timings.clear()
+            with silenced(not args.verbose):
+                result = load_solution(day)()
+            print(f"Day {day:>2}  {result}", flush=True)
+            print(f"{format_timings(timings)}\n", flush=True)
+        else:
+            result, stats = profile_day(day, not args.verbose)
+            print(f"Day {day:>2}  {result}", flush=True)
+            print(format_stats(stats, args.sort, args.top), flush=True)
+        caches = cache_report(f"Day_{day}.")
+        if caches:
+            print(f"Memoized functions\n{caches}\n", flush=True)
+        if args.output:
+            stats.dump_stats(os.path.join(args.output, f"Day_{day}.prof"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+import argparse
+import contextlib
+import functools
+import importlib
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+)
+from multiprocessing.connection import Connection
+from typing import Callable, Iterator
+
+from utils.cache import load_result
+from utils.utils import get_raw_input_stream
+
+DAYS = range(1, 26)
+PARTS = (1, 2)
+
+Solution = Callable[[], tuple]
+DayResult = dict[str, object]
+
+
+def parse_days(spec: str) -> list[int]:
+    """
+    Returns the sorted list of days described by spec. Accepts single days
+    and ranges separated by commas (i.e., '1-5,12,14')
+    """
+    days = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = part.split('-')
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(part))
+    invalid = [day for day in days if day not in DAYS]
+    if invalid:
+        raise ValueError(f"Invalid day(s): {invalid}")
+    return sorted(days)
+
+
+def load_solution(day: int) -> Solution:
+    """Returns the solution function found in Day_{day}/sol.py"""
+    module = importlib.import_module(f"Day_{day}.sol")
+    return module.solution
+
+
+def solve_data(day: int, data: str, part: int | None = None) -> object:
+    """
+    Returns the answer to one part of the day (or both parts if part is
+    None) for the raw input data using the parse and part_N functions found
+    in Day_{day}/sol.py
+    """
+    module = importlib.import_module(f"Day_{day}.sol")
+    ctx = module.parse(data)
+    if part is None:
+        return module.part_1(ctx), module.part_2(ctx)
+    return getattr(module, f"part_{part}")(ctx)
+
+
+def load_part(day: int, part: int) -> Callable[[], object]:
+    """
+    Returns a function that parses the day's input and solves only the
+    given part
+    """
+    def solve_part() -> object:
+        return solve_data(day, get_raw_input_stream(day), part)
+    return solve_part
+
+
+@contextlib.contextmanager
+def silenced(quiet: bool = True) -> Iterator[None]:
+    """Discards anything printed to stdout within the block if quiet is true"""
+    if not quiet:
+        yield
+        return
+    with open(os.devnull, "w") as devnull:
+        with contextlib.redirect_stdout(devnull):
+            yield
+
+
+def run_day(
+    day: int, quiet: bool = True, cached: bool = False,
+    part: int | None = None
+) -> DayResult:
+    """
+    Runs the solution for the given day (or only one part of it) and returns
+    the result along with the wall and cpu time spent. Output printed by the
+    solution is discarded when quiet is true. If cached is true, a result
+    stored by an earlier run is reused as long as nothing it depends on has
+    changed.
+    """
+    if part is None:
+        solution, name = load_solution(day), "solution"
+    else:
+        solution, name = load_part(day, part), f"part_{part}"
+    hit = False
+    with silenced(quiet):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        if cached:
+            result, hit = load_result(day, solution, name)
+        else:
+            result = solution()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+    return {
+        'day': day, 'result': result, 'wall': wall, 'cpu': cpu, 'cached': hit
+    }
+
+
+def send_result(conn: Connection, func: Callable, args: tuple) -> None:
+    """
+    Calls func with args and sends whether it succeeded along with its
+    result (or the exception it raised) through conn
+    """
+    try:
+        outcome = (True, func(*args))
+    except Exception as error:
+        outcome = (False, error)
+    conn.send(outcome)
+    conn.close()
+
+
+def call_with_timeout(
+    func: Callable, args: tuple = (), timeout: float | None = None
+) -> object:
+    """
+    Returns the result of calling func with args in a worker process.
+    Exceptions raised by func are raised again here. If no result arrives
+    within timeout seconds the worker is killed and TimeoutError is raised.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    worker = multiprocessing.Process(
+        target=send_result, args=(sender, func, args), daemon=True
+    )
+    worker.start()
+    sender.close()
+    try:
+        # A worker that dies without sending anything closes the pipe
+        if not receiver.poll(timeout):
+            raise TimeoutError(f"no result after {timeout}s")
+        try:
+            succeeded, value = receiver.recv()
+        except EOFError:
+            worker.join()
+            raise RuntimeError(
+                f"worker exited with code {worker.exitcode}"
+            ) from None
+    finally:
+        if worker.is_alive():
+            worker.kill()
+        worker.join()
+        receiver.close()
+    if not succeeded:
+        raise value
+    return value
+
+
+def error_result(day: int, error: Exception, wall: float) -> DayResult:
+    """Returns the result of a day that failed (or timed out) with error"""
+    return {
+        'day': day, 'result': None,
+        'error': f"{type(error).__name__}: {error}",
+        'wall': wall, 'cpu': 0.0, 'cached': False
+    }
+
+
+def try_run_day(
+    day: int, quiet: bool = True, cached: bool = False,
+    part: int | None = None
+) -> DayResult:
+    """
+    Runs the day like run_day. Errors are reported in the result instead of
+    being raised so one failing day does not stop a run.
+    """
+    start = time.perf_counter()
+    try:
+        return run_day(day, quiet, cached, part)
+    except Exception as error:
+        return error_result(day, error, time.perf_counter() - start)
+
+
+def run_day_with_timeout(
+    day: int, timeout: float, quiet: bool = True, cached: bool = False,
+    part: int | None = None
+) -> DayResult:
+    """
+    Runs the day like try_run_day in a worker process of its own, which is
+    killed if the day takes longer than timeout seconds. A day that timed
+    out (or whose worker died) is reported as an error.
+    """
+    start = time.perf_counter()
+    try:
+        return call_with_timeout(
+            try_run_day, (day, quiet, cached, part), timeout
+        )
+    except Exception as error:
+        return error_result(day, error, time.perf_counter() - start)
+
+
+def format_result(day_result: DayResult) -> str:
+    """Returns a one line summary of a day's result"""
+    if 'error' in day_result:
+        return (
+            f"Day {day_result['day']:>2}  "
+            f"wall {day_result['wall']:>9.3f}s  "
+            f"{day_result['error']}"
+        )
+    return (
+        f"Day {day_result['day']:>2}  "
+        f"wall {day_result['wall']:>9.3f}s  "
+        f"cpu {day_result['cpu']:>9.3f}s  "
+        f"{day_result['result']}"
+        f"{'  (cached)' if day_result.get('cached') else ''}"
+    )
+
+
+def run_days(
+    days: list[int], jobs: int | None = None, quiet: bool = True,
+    cached: bool = False, part: int | None = None,
+    timeout: float | None = None
+) -> list[DayResult]:
+    """
+    Runs the solutions for the given days in a process pool and prints each
+    result as it finishes. Returns the results sorted by day. Days that fail
+    are reported as errors without stopping the others. With a timeout
+    every day gets a worker process of its own (at most jobs at a time) that
+    is killed once the day runs longer than timeout seconds, since a process
+    pool cannot stop a task that already started.
+    """
+    results = []
+    start = time.perf_counter()
+    if timeout is None:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        submit = functools.partial(executor.submit, try_run_day)
+    else:
+        # The threads only wait on the workers
+        executor = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+        submit = functools.partial(
+            executor.submit, run_day_with_timeout, timeout=timeout
+        )
+    with executor:
+        futures = {
+            submit(day, quiet=quiet, cached=cached, part=part): day
+            for day in days
+        }
+        for future in as_completed(futures):
+            try:
+                day_result = future.result()
+            except Exception as error:
+                # i.e., the pool broke because a worker was killed
+                day_result = error_result(
+                    futures[future], error, time.perf_counter() - start
+                )
+            print(format_result(day_result), flush=True)
+            results.append(day_result)
+    return sorted(results, key=lambda day_result: day_result['day'])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Runs the Advent of Code solutions in parallel"
+    )
+    parser.add_argument(
+        "--days", default="1-25", help="days to run (i.e., '1-25' or '6,12')"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="number of worker processes (defaults to the number of cores)"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true",
+        help="show output printed by the solutions"
+    )
+    parser.add_argument(
+        "--cached", action="store_true",
+        help="reuse results of earlier runs when nothing relevant changed"
+    )
+    parser.add_argument(
+        "--part", type=int, choices=PARTS,
+        help="only solve one part of each day"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=None,
+        help="seconds a day may run before its worker is killed"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = run_days(
+        parse_days(args.days), args.jobs, not args.verbose, args.cached,
+        args.part, args.timeout
+    )
+    total_wall = time.perf_counter() - start
+    total_cpu = sum([day_result['cpu'] for day_result in results])
+    print(f"Total   wall {total_wall:>9.3f}s  cpu {total_cpu:>9.3f}s")
+    failed = [
+        day_result['day'] for day_result in results if 'error' in day_result
+    ]
+    if failed:
+        print(f"Failed: {failed}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import heapq
+from collections import deque
+from itertools import count
+from typing import Callable, Hashable, Iterable, NamedTuple
+
+State = Hashable
+Neighbors = Callable[[State], Iterable[State]]
+WeightedNeighbors = Callable[[State], Iterable[tuple[State, int]]]
+Heuristic = Callable[[State], int]
+Goal = Callable[[State], bool]
+
+
+class SearchResult(NamedTuple):
+    """
+    The outcome of a weighted search. costs holds the cheapest known cost of
+    every reached state, previous holds every predecessor a state can be
+    reached from at that cost, and goals holds the goal states reached at
+    the lowest cost (empty if no goal was reached).
+    """
+    costs: dict[State, int]
+    previous: dict[State, list[State]]
+    goals: list[State]
+
+
+def bfs(
+    start: State, neighbors: Neighbors, goal: State | None = None
+) -> dict[State, int]:
+    """
+    Returns the number of steps from start to every reachable state. Stops
+    as soon as goal is reached if one is given.
+    """
+    steps = {start: 0}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        next_steps = steps[state] + 1
+        for neighbor in neighbors(state):
+            if neighbor in steps:
+                continue
+            steps[neighbor] = next_steps
+            if neighbor == goal:
+                return steps
+            queue.append(neighbor)
+    return steps
+
+
+def astar(
+    start: State, neighbors: WeightedNeighbors, is_goal: Goal | None = None,
+    heuristic: Heuristic | None = None
+) -> SearchResult:
+    """
+    Searches from start in order of cost plus heuristic. The heuristic must
+    never overestimate the remaining cost (and be consistent). Every
+    predecessor on a cheapest path is recorded, and the search continues
+    until all goal states tied for the lowest cost are found. Without a goal
+    the whole reachable space is searched.
+    """
+    costs = {start: 0}
+    previous = {start: []}
+    goals = []
+    settled = set()
+    tie_breaker = count()
+    heap = [(heuristic(start) if heuristic else 0, next(tie_breaker), start)]
+    best = None
+
+    while heap:
+        priority, _, state = heapq.heappop(heap)
+        if best is not None and priority > best:
+            break
+        if state in settled:
+            continue
+        settled.add(state)
+        cost = costs[state]
+
+        if is_goal is not None and is_goal(state):
+            best = cost
+            goals.append(state)
+            continue
+
+        for neighbor, weight in neighbors(state):
+            new_cost = cost + weight
+            old_cost = costs.get(neighbor)
+            if old_cost is None or new_cost < old_cost:
+                costs[neighbor] = new_cost
+                previous[neighbor] = [state]
+                estimate = heuristic(neighbor) if heuristic else 0
+                heapq.heappush(
+                    heap, (new_cost + estimate, next(tie_breaker), neighbor)
+                )
+            elif new_cost == old_cost:
+                previous[neighbor].append(state)
+    return SearchResult(costs, previous, goals)
+
+
+def dijkstra(
+    start: State, neighbors: WeightedNeighbors, is_goal: Goal | None = None
+) -> SearchResult:
+    """Returns the result of a cheapest first search (A* without heuristic)"""
+    return astar(start, neighbors, is_goal)
+
+
+def shortest_path_states(
+    result: SearchResult, ends: Iterable[State] | None = None
+) -> set[State]:
+    """
+    Returns every state found on any cheapest path from the start to the
+    given ends (defaults to the goals of the search)
+    """
+    ends = result.goals if ends is None else ends
+    on_path = set(ends)
+    stack = list(on_path)
+    while stack:
+        for state in result.previous.get(stack.pop(), []):
+            if state not in on_path:
+                on_path.add(state)
+                stack.append(state)
+    return on_path
@@ -0,0 +1,188 @@
+import argparse
+import importlib
+import json
+import os
+import shlex
+import socketserver
+import time
+from collections import OrderedDict
+from types import ModuleType
+
+from utils.client import SOCKET_PATH
+from utils.runner import DAYS, PARTS, parse_days, silenced
+from utils.utils import build_fp
+
+# The path of an input along with its modification time and size, so an
+# input that changed on disk is parsed again
+InputKey = tuple[int, str, int, int]
+
+
+class Solver:
+    """
+    Keeps every day module imported and the most recently used parsed inputs
+    in memory so repeated requests skip the imports and the parsing
+    """
+
+    def __init__(self, max_inputs: int = 64) -> None:
+        self.modules = {day: get_module(day) for day in DAYS}
+        self.max_inputs = max_inputs
+        self.parsed: OrderedDict[InputKey, object] = OrderedDict()
+
+    def load(self, day: int, fp: str) -> object:
+        """Returns the parsed input of the day found at fp"""
+        stat = os.stat(fp)
+        key = (day, fp, stat.st_mtime_ns, stat.st_size)
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key]
+
+        with open(fp, "r") as file_obj:
+            ctx = self.modules[day].parse(file_obj.read())
+        self.parsed[key] = ctx
+        if len(self.parsed) > self.max_inputs:
+            self.parsed.popitem(last=False)
+        return ctx
+
+    def solve(
+        self, day: int, part: int | None = None, fp: str | None = None
+    ) -> object:
+        """
+        Returns the answer to one part of the day (or both parts if part is
+        None) for the input at fp, defaulting to the day's input.txt
+        """
+        module = self.modules[day]
+        with silenced():
+            ctx = self.load(day, build_fp(day) if fp is None else fp)
+            if part is None:
+                return module.part_1(ctx), module.part_2(ctx)
+            return getattr(module, f"part_{part}")(ctx)
+
+
+def get_module(day: int) -> ModuleType:
+    """Returns the Day_{day}.sol module"""
+    return importlib.import_module(f"Day_{day}.sol")
+
+
+def parse_request(line: str) -> tuple[str, dict[str, str]]:
+    """
+    Returns the command and the key=value arguments of a request line
+    (i.e., 'solve day=14 part=1 input=/tmp/input.txt'). Arguments are split
+    like a shell command, so values containing spaces can be quoted
+    (i.e., "input='/tmp/my inputs/14.txt'").
+    """
+    command, *args = shlex.split(line)
+    options = {}
+    for arg in args:
+        key, sep, value = arg.partition("=")
+        if not sep:
+            raise ValueError(f"Expected key=value, got {arg!r}")
+        options[key] = value
+    return command, options
+
+
+def handle_solve(solver: Solver, options: dict[str, str]) -> dict:
+    """Returns the response to a solve request"""
+    unknown = set(options) - {"day", "part", "input"}
+    if unknown:
+        raise ValueError(f"Unknown argument(s): {sorted(unknown)}")
+    if "day" not in options:
+        raise ValueError("Missing day")
+    day = int(options["day"])
+    if day not in DAYS:
+        raise ValueError(f"Invalid day: {day}")
+    part = int(options["part"]) if "part" in options else None
+    if part is not None and part not in PARTS:
+        raise ValueError(f"Invalid part: {part}")
+
+    start = time.perf_counter()
+    result = solver.solve(day, part, options.get("input"))
+    return {
+        'day': day,
+        'part': part,
+        'result': result,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answers each request line with one json line"""
+
+    def handle(self) -> None:
+        for raw_line in self.rfile:
+            line = raw_line.decode().strip()
+            if not line:
+                continue
+            try:
+                command, options = parse_request(line)
+                if command == "solve":
+                    response = handle_solve(self.server.solver, options)
+                elif command == "ping":
+                    response = {'result': "pong"}
+                elif command == "stop":
+                    response = {'result': "stopping"}
+                    self.server.stopping = True
+                else:
+                    raise ValueError(f"Unknown command: {command!r}")
+            except Exception as error:
+                response = {'error': f"{type(error).__name__}: {error}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    """
+    Serves solve requests one at a time. Requests are not handled in
+    threads since the solutions' output is silenced by redirecting stdout,
+    which is shared by the whole process.
+    """
+
+    def __init__(self, socket_path: str, solver: Solver) -> None:
+        self.solver = solver
+        self.stopping = False
+        super().__init__(socket_path, RequestHandler)
+
+
+def serve(
+    socket_path: str = SOCKET_PATH, warm: list[int] | None = None,
+    max_inputs: int = 64
+) -> None:
+    """
+    Imports every day, parses the default input of the days in warm and
+    serves requests on the unix socket until a stop request is received
+    """
+    solver = Solver(max_inputs)
+    with silenced():
+        for day in warm or []:
+            solver.load(day, build_fp(day))
+
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    with SolverServer(socket_path, solver) as server:
+        print(f"Listening on {socket_path}", flush=True)
+        try:
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            os.remove(socket_path)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Serves the Advent of Code solutions over a unix socket"
+    )
+    parser.add_argument("--socket", default=SOCKET_PATH)
+    parser.add_argument(
+        "--warm", default="",
+        help="days whose input is parsed up front (i.e., '1-11,13-25')"
+    )
+    parser.add_argument(
+        "--max-inputs", type=int, default=64,
+        help="number of parsed inputs kept in memory"
+    )
+    args = parser.parse_args(argv)
+    serve(args.socket, parse_days(args.warm), args.max_inputs)
+
+
+if __name__ == "__main__":
+    main()
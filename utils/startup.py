@@ -0,0 +1,111 @@
+import argparse
+import subprocess
+import sys
+
+from utils.runner import DAYS, parse_days
+from utils.utils import PARENT_DIR
+
+# The module, the microseconds spent in it alone and including the modules
+# it imported, and how deeply nested the import was
+ImportTime = tuple[str, int, int, int]
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Returns the entries found in the output of python -X importtime"""
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[12:].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(
+            (name.strip(), int(self_us), int(cumulative_us), depth)
+        )
+    return imports
+
+
+def time_imports(modules: list[str]) -> list[ImportTime]:
+    """
+    Imports the modules in a fresh interpreter started from the root of the
+    repo and returns the import times it reports
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import {', '.join(modules)}"],
+        cwd=PARENT_DIR, capture_output=True, text=True, check=True
+    )
+    return parse_importtime(process.stderr)
+
+
+def total_time(imports: list[ImportTime], modules: list[str]) -> int:
+    """
+    Returns the microseconds spent importing the modules, including the
+    modules they imported that were not loaded during startup
+    """
+    return sum([
+        cumulative for name, _, cumulative, depth in imports
+        if depth == 0 and name in modules
+    ])
+
+
+def measure_startup(
+    modules: list[str], repeat: int = 5
+) -> tuple[int, list[ImportTime]]:
+    """
+    Returns the fastest total import time of the modules out of repeated
+    runs along with the import times of that run
+    """
+    runs = []
+    for _ in range(repeat):
+        imports = time_imports(modules)
+        runs.append((total_time(imports, modules), imports))
+    return min(runs, key=lambda run: run[0])
+
+
+def format_slowest(imports: list[ImportTime], top: int) -> str:
+    """Returns the modules that took the longest to import by themselves"""
+    lines = []
+    ordered = sorted(imports, key=lambda entry: entry[1], reverse=True)
+    for name, self_us, cumulative_us, _ in ordered[:top]:
+        lines.append(
+            f"{self_us / 1000:>9.2f}ms  {cumulative_us / 1000:>9.2f}ms  "
+            f"{name}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Fails if importing the day modules exceeds a budget"
+    )
+    parser.add_argument(
+        "--days", default=f"{DAYS[0]}-{DAYS[-1]}",
+        help="days to import (i.e., '1-25' or '13')"
+    )
+    parser.add_argument(
+        "--budget", type=float, default=50.0,
+        help="allowed import time in milliseconds"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--top", type=int, default=10,
+        help="number of slowest modules to show"
+    )
+    args = parser.parse_args(argv)
+
+    modules = [f"Day_{day}.sol" for day in parse_days(args.days)]
+    total, imports = measure_startup(modules, args.repeat)
+    print(f"{'self':>11}  {'cumulative':>11}  module")
+    print(format_slowest(imports, args.top))
+    print(
+        f"\nImporting {len(modules)} day module(s) took "
+        f"{total / 1000:.2f}ms (budget {args.budget:.2f}ms)"
+    )
+    if total / 1000 > args.budget:
+        print("Over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
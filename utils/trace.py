@@ -0,0 +1,56 @@
+import atexit
+import os
+import sys
+from typing import Iterable, TextIO
+
+# Read once at import time. Call sites guard every event with
+# 'if TRACING:' so nothing is built, formatted or written when tracing is
+# off, leaving a single global lookup per call site.
+TRACING = os.environ.get("AOC_TRACE", "0") == "1"
+TRACE_FILE = os.environ.get("AOC_TRACE_FILE")
+FRAMES_FILE = os.environ.get("AOC_TRACE_FRAMES")
+
+_sinks: dict[str, TextIO] = {}
+
+
+def get_sink(fp: str | None) -> TextIO:
+    """Returns the file traces are appended to (stderr if fp is None)"""
+    if fp is None:
+        return sys.stderr
+    if fp not in _sinks:
+        _sinks[fp] = open(fp, "a")
+    return _sinks[fp]
+
+
+@atexit.register
+def close_sinks() -> None:
+    """Closes the trace files that were opened"""
+    for sink in _sinks.values():
+        sink.close()
+    _sinks.clear()
+
+
+def emit(event: str, **fields: object) -> None:
+    """
+    Writes an event along with its fields as one json line to
+    AOC_TRACE_FILE (or stderr)
+    """
+    import json
+
+    record = {'event': event, **fields}
+    sink = get_sink(TRACE_FILE)
+    sink.write(json.dumps(record, default=str) + "\n")
+    # Worker processes of a pool exit without running atexit handlers
+    sink.flush()
+
+
+def dump_frame(title: str, rows: str | Iterable[Iterable[object]]) -> None:
+    """
+    Writes a picture of a grid (a string or rows of cells) under a title to
+    AOC_TRACE_FRAMES, or to the event sink if no frames file is set
+    """
+    if not isinstance(rows, str):
+        rows = "\n".join(["".join(map(str, row)) for row in rows])
+    sink = get_sink(FRAMES_FILE or TRACE_FILE)
+    sink.write(f"--- {title}\n{rows}\n")
+    sink.flush()
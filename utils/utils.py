@@ -1,7 +1,19 @@
+import mmap
 import os
+import re
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import numpy as np
 
 PARENT_DIR = os.path.dirname(os.path.dirname(__file__))
 
+INT_PATTERN = re.compile(r"-?\d+")
+INT_BYTES_PATTERN = re.compile(rb"-?\d+")
+
+Buffer = str | bytes | bytearray | mmap.mmap
+
 
 def build_fp(day: int) -> str:
     return os.path.join(PARENT_DIR, f"Day_{day}", "input.txt")
@@ -16,10 +28,47 @@ def extract_data_to_list(day: int) -> list[str]:
     fp = build_fp(day)
 
     with open(fp, "r") as file_obj:
-        data = [line.strip() for line in file_obj.readlines()]
+        data = [line.strip() for line in file_obj]
     return data
 
 
+def iter_lines(day: int) -> Iterator[str]:
+    """
+    Yields the lines found in the day's input.txt file one at a time
+    without reading the whole file. Removes the '\n' character from each
+    line.
+    """
+    with open(build_fp(day), "r") as file_obj:
+        for line in file_obj:
+            yield line.strip()
+
+
+def iter_blocks(day: int) -> Iterator[list[str]]:
+    """
+    Yields the blocks of lines separated by blank lines in the day's
+    input.txt file one block at a time
+    """
+    return group_blocks(iter_lines(day))
+
+
+def group_blocks(lines: Iterable[str]) -> Iterator[list[str]]:
+    """
+    Yields the blocks of lines separated by blank lines one block at a time.
+    Surrounding whitespace (including '\r' line endings) is removed from
+    every line.
+    """
+    block = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
 def extract_data_to_list_of_list(day: int) -> list[list[str]]:
     """
     Returns a list of list of characters found in a day's input.txt
@@ -39,10 +88,7 @@ def extract_to_grid_of_ints(day: int) -> list[list[int]]:
 
 def merge_strings(data: list[str]) -> str:
     """Returns one string composed of all of the strings in the input"""
-    merged_string = ""
-    for item in data:
-        merged_string += item
-    return merged_string
+    return "".join(data)
 
 
 def get_raw_input_stream(day: int) -> str:
@@ -50,5 +96,235 @@ def get_raw_input_stream(day: int) -> str:
     fp = build_fp(day)
 
     with open(fp, "r") as file_obj:
-        data = [line for line in file_obj.readlines()]
-    return merge_strings(data)
+        return file_obj.read()
+
+
+def split_lines(data: str) -> list[str]:
+    """
+    Returns the lines of the raw data with surrounding whitespace removed,
+    matching what extract_data_to_list returns for the same input
+    """
+    return [line.strip() for line in data.splitlines()]
+
+
+class MappedInput:
+    """
+    A read only memory map of an input file. The whole file is available as
+    bytes without being read into memory up front, and lines are found
+    through an index of line start offsets so each line can be sliced out of
+    the map (as a zero copy memoryview) without splitting the whole file.
+
+    Line views stay valid after close() (or the end of a with block) for as
+    long as they are referenced. The file is only unmapped once the last of
+    them is dropped or released, so copy a line with bytes() to keep it
+    without holding on to the map.
+    """
+
+    def __init__(self, fp: str) -> None:
+        with open(fp, "rb") as file_obj:
+            if os.fstat(file_obj.fileno()).st_size:
+                self.data = mmap.mmap(
+                    file_obj.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            else:
+                # Empty files cannot be memory mapped
+                self.data = b""
+        self.view = memoryview(self.data)
+        self._offsets = None
+
+    @property
+    def offsets(self) -> array:
+        """
+        Returns the start offset of every line followed by the offset one
+        past the end of the data (built on first use)
+        """
+        if self._offsets is None:
+            offsets = array('q', [0])
+            end = len(self.data)
+            idx = self.data.find(b"\n")
+            while idx != -1:
+                offsets.append(idx + 1)
+                idx = self.data.find(b"\n", idx + 1)
+            if offsets[-1] != end:
+                offsets.append(end + 1)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, idx: int) -> memoryview:
+        """Returns line idx without its line ending as a view of the map"""
+        if idx < 0:
+            idx += len(self)
+        start, end = self.offsets[idx], self.offsets[idx + 1] - 1
+        if end > start and self.data[end - 1:end] == b"\r":
+            end -= 1
+        return self.view[start:end]
+
+    def close(self) -> None:
+        """
+        Releases the view and closes the memory map, or leaves closing it
+        to the line views that are still alive
+        """
+        self.view.release()
+        if isinstance(self.data, mmap.mmap):
+            try:
+                self.data.close()
+            except BufferError:
+                # Unmapped when the last line view goes away
+                pass
+        self.data = b""
+
+    def __enter__(self) -> "MappedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def map_input(day: int) -> MappedInput:
+    """Returns the day's input.txt file memory mapped as a MappedInput"""
+    return MappedInput(build_fp(day))
+
+
+def find_int_tokens(data: Buffer) -> list[str] | list[bytes]:
+    """Returns the text of every (signed) integer found in data"""
+    if isinstance(data, str):
+        return INT_PATTERN.findall(data)
+    return INT_BYTES_PATTERN.findall(data)
+
+
+def extract_ints(data: Buffer) -> array:
+    """
+    Returns every (signed) integer found in data, in order, as an
+    array('q'). A '-' directly before a number is read as its sign.
+    """
+    return array('q', map(int, find_int_tokens(data)))
+
+
+def extract_int_records(data: Buffer, columns: int) -> list[tuple[int, ...]]:
+    """
+    Returns the integers found in data grouped into records of columns
+    integers each (i.e., 4 for Day 14's 'p=x,y v=x,y' robots)
+    """
+    ints = extract_ints(data)
+    if len(ints) % columns:
+        raise ValueError(
+            f"Found {len(ints)} integers, not a multiple of {columns}"
+        )
+    return list(zip(*[iter(ints)] * columns))
+
+
+def extract_ints_array(
+    data: Buffer, columns: int | None = None
+) -> "np.ndarray":
+    """
+    Returns every (signed) integer found in data as an int64 NumPy array
+    converted in one operation. The array is reshaped into rows of columns
+    integers if columns is given.
+    """
+    import numpy as np
+
+    ints = np.array(find_int_tokens(data)).astype(np.int64)
+    return ints if columns is None else ints.reshape(-1, columns)
+
+
+class Grid:
+    """
+    A grid of characters stored row by row in one flat bytearray. The grid
+    is surrounded by a border of sentinel cells (padding cells deep) so the
+    neighbors of any cell on the grid can be read without bounds checks.
+    Cells are addressed by their flat index: moving one row is +/- stride
+    and moving one column is +/- 1.
+    """
+
+    SENTINEL = 0
+
+    def __init__(self, rows: list[str], padding: int = 1) -> None:
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        self.padding = padding
+        self.stride = self.width + 2 * padding
+        border = bytes(self.stride * padding)
+        side = bytes(padding)
+        self.cells = bytearray(border)
+        for row in rows:
+            self.cells += side + row.encode() + side
+        self.cells += border
+
+        # North, East, South and West (clockwise)
+        self.moves = (-self.stride, 1, self.stride, -1)
+        # The four moves above followed by NE, SE, SW and NW
+        self.diagonal_moves = self.moves + (
+            1 - self.stride, 1 + self.stride, self.stride - 1, -self.stride - 1
+        )
+
+    def index(self, row: int, col: int) -> int:
+        """Returns the flat index of the cell at row, col"""
+        return (row + self.padding) * self.stride + col + self.padding
+
+    def point(self, idx: int) -> tuple[int, int]:
+        """Returns the row, col of the cell at the flat index"""
+        row, col = divmod(idx, self.stride)
+        return row - self.padding, col - self.padding
+
+    def __getitem__(self, idx: int) -> str:
+        return chr(self.cells[idx])
+
+    def __setitem__(self, idx: int, char: str) -> None:
+        self.cells[idx] = ord(char)
+
+    def in_grid(self, idx: int) -> bool:
+        """Returns true if idx is a cell of the grid (not the border)"""
+        return self.cells[idx] != self.SENTINEL
+
+    def contains(self, row: int, col: int) -> bool:
+        """
+        Returns true if row, col is a cell of the grid, which also works for
+        points any distance off the grid
+        """
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def neighbors(self, idx: int) -> list[int]:
+        """Returns the indices of the cells above, right, below and left"""
+        return [idx + move for move in self.moves]
+
+    def find(self, char: str, start: int = 0) -> int:
+        """Returns the flat index of the first char at or after start or -1"""
+        return self.cells.find(ord(char), start)
+
+    def find_all(self, char: str) -> list[int]:
+        """Returns the flat indices of every cell containing char"""
+        indices = []
+        idx = self.cells.find(ord(char))
+        while idx != -1:
+            indices.append(idx)
+            idx = self.cells.find(ord(char), idx + 1)
+        return indices
+
+    def rows(self) -> list[str]:
+        """Returns the rows of the grid without the border"""
+        rows = []
+        for row in range(self.height):
+            start = self.index(row, 0)
+            rows.append(self.cells[start:start + self.width].decode())
+        return rows
+
+    def copy(self) -> "Grid":
+        """Returns a copy of the grid"""
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells[:]
+        return grid
+
+    def __str__(self) -> str:
+        return "\n".join(self.rows())
+
+
+def extract_to_grid(day: int, padding: int = 1) -> Grid:
+    """
+    Returns the characters found in a day's input.txt file as a Grid
+    surrounded by padding sentinel cells
+    """
+    return Grid(extract_data_to_list(day), padding)